@@ -14,5 +14,10 @@ class AuthorAdmin(admin.ModelAdmin):
 class BookAdmin(admin.ModelAdmin):
     """Admin configuration for Book model"""
     list_display = ['id', 'title', 'publication_year', 'author']
-    list_filter = ['publication_year', 'author']
+    # Only offer authors that actually have books in the filter sidebar
+    list_filter = ['publication_year', ('author', admin.RelatedOnlyFieldListFilter)]
     search_fields = ['title', 'author__name']
+    # Join the author in the changelist query instead of one lookup per row
+    list_select_related = ('author',)
+    # Search authors instead of rendering every author in a <select>
+    autocomplete_fields = ['author']
@@ -0,0 +1,60 @@
+"""
+Cache helpers for Book API responses.
+
+Cached list pages and response ETags are derived from a version token. Any
+write to a Book or Author swaps the token (see the signal receivers in
+models.py), so every cached page and ETag is invalidated at once without
+tracking individual keys.
+
+Single books are cached under their primary key instead, and dropped one at
+a time when that book is saved or deleted.
+"""
+
+import hashlib
+import uuid
+
+from django.core.cache import cache
+
+# How long a cached book list page stays valid (15 minutes)
+BOOK_CACHE_TIMEOUT = 60 * 15
+
+_BOOK_LIST_VERSION_KEY = 'books:list:version'
+
+
+def _new_version():
+    return uuid.uuid4().hex
+
+
+def book_data_version():
+    """Return the token identifying the current state of book and author data."""
+    return cache.get_or_set(_BOOK_LIST_VERSION_KEY, _new_version, None)
+
+
+def book_list_cache_key(url):
+    """
+    Return the cache key for a book list page.
+    
+    Args:
+        url: The absolute request URL, including filter/search/ordering/cursor parameters
+        
+    Returns:
+        A fixed-length cache key tied to the current data version
+    """
+    version = book_data_version()
+    digest = hashlib.md5(url.encode('utf-8')).hexdigest()
+    return f'books:list:{version}:{digest}'
+
+
+def invalidate_book_list_cache():
+    """Invalidate every cached book list page by switching to a new version."""
+    cache.set(_BOOK_LIST_VERSION_KEY, _new_version(), None)
+
+
+def book_detail_cache_key(pk):
+    """Return the cache key for a single Book instance."""
+    return f'book:{pk}'
+
+
+def invalidate_book_detail_cache(pk):
+    """Drop the cached Book instance with the given primary key."""
+    cache.delete(book_detail_cache_key(pk))
@@ -0,0 +1,21 @@
+import django_filters
+from .models import Book
+
+
+class BookFilter(django_filters.FilterSet):
+    """
+    FilterSet for the Book list endpoint.
+    
+    Declared once at import time so DjangoFilterBackend does not build a new
+    FilterSet class from filterset_fields on every request.
+    
+    Filters (all exact matches):
+        - title: The book's title
+        - author__name: The author's name
+        - publication_year: The year of publication
+    """
+    author__name = django_filters.CharFilter(field_name='author__name', lookup_expr='exact')
+    
+    class Meta:
+        model = Book
+        fields = ['title', 'author__name', 'publication_year']
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 04:39
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_book_book_auth_year_idx_book_book_auth_title_idx'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='book',
+            options={'ordering': ['title']},
+        ),
+    ]
@@ -0,0 +1,39 @@
+from django.db import migrations
+
+
+# Django compiles icontains on PostgreSQL to UPPER(column) LIKE UPPER(%s),
+# so trigram GIN indexes on UPPER(column) let the admin and API search use
+# an index instead of scanning every row.
+TRIGRAM_INDEXES = [
+    ('book_title_trgm', 'api_book', 'title'),
+    ('author_name_trgm', 'api_author', 'name'),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for index_name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {index_name} ON {table} '
+            f'USING gin (UPPER({column}::text) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for index_name, _table, _column in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {index_name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_alter_book_options'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
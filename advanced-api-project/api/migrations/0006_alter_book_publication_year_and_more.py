@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-15 04:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_trigram_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='book',
+            name='publication_year',
+            field=models.PositiveSmallIntegerField(db_index=True),
+        ),
+        migrations.AddConstraint(
+            model_name='book',
+            constraint=models.CheckConstraint(condition=models.Q(('publication_year__gte', 0), ('publication_year__lte', 9999)), name='book_publication_year_range'),
+        ),
+    ]
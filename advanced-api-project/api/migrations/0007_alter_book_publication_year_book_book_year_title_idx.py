@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-15 04:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0006_alter_book_publication_year_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='book',
+            name='publication_year',
+            field=models.PositiveSmallIntegerField(),
+        ),
+        migrations.AddIndex(
+            model_name='book',
+            index=models.Index(fields=['publication_year', 'title'], name='book_year_title_idx'),
+        ),
+    ]
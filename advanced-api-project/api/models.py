@@ -1,7 +1,17 @@
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .cache import invalidate_book_detail_cache, invalidate_book_list_cache
 
 # Create your models here.
 
+class BookManager(models.Manager):
+    """Default Book manager that always joins the author."""
+    
+    def get_queryset(self):
+        return super().get_queryset().select_related('author')
+
+
 class Author(models.Model):
     """
     Author model represents a book author.
@@ -12,7 +22,7 @@ class Author(models.Model):
     Relationships:
         One-to-Many with Book model - An author can have multiple books
     """
-    name = models.CharField(max_length=100)
+    name = models.CharField(max_length=100, db_index=True)
     
     def __str__(self):
         return self.name
@@ -24,20 +34,58 @@ class Book(models.Model):
     
     Fields:
         title: The title of the book (max 200 characters)
-        publication_year: The year the book was published (integer)
+        publication_year: The year the book was published (0-9999, stored as a small integer)
         author: Foreign key relationship to Author model
     
     Relationships:
         Many-to-One with Author model - Each book has one author,
         but an author can have multiple books
     """
-    title = models.CharField(max_length=200)
-    publication_year = models.IntegerField()
+    title = models.CharField(max_length=200, db_index=True)
+    publication_year = models.PositiveSmallIntegerField()
     author = models.ForeignKey(
         Author,
         on_delete=models.CASCADE,
         related_name='books'  # Allows reverse lookup: author.books.all()
     )
     
+    # Every Book query joins its author, so callers cannot forget select_related
+    objects = BookManager()
+    
+    class Meta:
+        # Default ordering applied in the database, so list views need no extra sort
+        ordering = ['title']
+        # Composite indexes for filtering by author or publication_year
+        # combined with ordering by publication_year or title. Each index can
+        # be scanned in either direction, so descending orders need no
+        # separate index. book_year_title_idx also serves plain
+        # publication_year filters, so that column has no index of its own.
+        indexes = [
+            models.Index(fields=['author', 'publication_year'], name='book_auth_year_idx'),
+            models.Index(fields=['author', 'title'], name='book_auth_title_idx'),
+            models.Index(fields=['publication_year', 'title'], name='book_year_title_idx'),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(publication_year__gte=0) & models.Q(publication_year__lte=9999),
+                name='book_publication_year_range',
+            ),
+        ]
+    
     def __str__(self):
         return f"{self.title} ({self.publication_year})"
+
+
+# Drop cached book list pages whenever a book or author changes, so create,
+# update and delete views need no cache handling of their own.
+# Note: bulk_create() and QuerySet.update()/delete() do not send these signals.
+@receiver([post_save, post_delete], sender=Book)
+@receiver([post_save, post_delete], sender=Author)
+def invalidate_book_caches(sender, **kwargs):
+    invalidate_book_list_cache()
+
+
+# Drop the cached copy of a single book when that book is saved or deleted.
+@receiver([post_save, post_delete], sender=Book)
+def invalidate_book_detail(sender, instance, **kwargs):
+    invalidate_book_detail_cache(instance.pk)
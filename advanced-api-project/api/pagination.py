@@ -0,0 +1,15 @@
+from rest_framework.pagination import CursorPagination
+
+
+class BookCursorPagination(CursorPagination):
+    """
+    Cursor pagination for the Book list endpoint.
+    
+    Each page is fetched with a WHERE clause on the ordering column instead of
+    LIMIT/OFFSET, so deep pages cost the same as the first one. The default
+    ordering matches the API's alphabetical default, with id as a tie-breaker
+    so books sharing a title are neither skipped nor repeated across pages; an
+    ?ordering= parameter handled by OrderingFilter takes precedence.
+    """
+    page_size = 50
+    ordering = ('title', 'id')
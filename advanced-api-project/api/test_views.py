@@ -22,13 +22,26 @@ session-based authentication (self.client.login). Token auth is more appropriate
 """
 
 from django.contrib.auth.models import User
-from django.urls import reverse
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse, reverse_lazy
 from rest_framework import status
 from rest_framework.test import APITestCase, APIClient
 from rest_framework.authtoken.models import Token
 from .models import Author, Book
+from .serializers import BookSerializer
 
 
+# URLs without path parameters are resolved once at import rather than per test
+BOOK_LIST_URL = reverse_lazy('book-list')
+BOOK_CREATE_URL = reverse_lazy('book-create')
+BOOK_BULK_CREATE_URL = reverse_lazy('book-bulk-create')
+
+# Primary key that never matches a test book, used for 404 checks
+MISSING_PK = 9999
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
 class BookAPITestCase(APITestCase):
     """
     Base test case class with common setup for all Book API tests.
@@ -37,29 +50,39 @@ class BookAPITestCase(APITestCase):
     Note: APITestCase automatically uses a separate test database that is created
     at the start of the test run and destroyed at the end, ensuring no impact on
     production or development data.
+    
+    Passwords are hashed with MD5 here because the default PBKDF2 hasher is
+    deliberately slow; the weak hash never leaves the throwaway test database.
     """
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """
-        Set up test data before each test method.
+        Set up test data once per test class.
         Creates users, authors, books, and authentication tokens.
         
-        This method runs before each test, ensuring a clean state with fresh test data.
+        Each test runs inside a transaction that is rolled back afterwards, and
+        Django gives every test its own copy of these attributes, so tests still
+        start from a clean state without re-inserting the fixtures.
         All data is created in the test database, which is separate from production/dev.
         """
         # Create test users
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username='testuser',
             password='testpass123'
         )
-        self.other_user = User.objects.create_user(
+        cls.other_user = User.objects.create_user(
             username='otheruser',
             password='otherpass123'
         )
         
         # Create authentication tokens for API authentication
-        self.token = Token.objects.create(user=self.user)
-        self.other_token = Token.objects.create(user=self.other_user)
+        cls.token, _ = Token.objects.get_or_create(user=cls.user)
+        cls.other_token, _ = Token.objects.get_or_create(user=cls.other_user)
+        
+        # Preformat the Authorization headers so tests don't rebuild them
+        cls.auth_header = f'Token {cls.token.key}'
+        cls.other_auth_header = f'Token {cls.other_token.key}'
         
         # Configure test database - Django automatically uses a separate test database
         # This can also be configured in settings with TEST database settings
@@ -67,26 +90,46 @@ class BookAPITestCase(APITestCase):
         # Example of session-based login (alternative to token auth):
         # logged_in = self.client.login(username='testuser', password='testpass123')
         
-        # Create test authors
-        self.author1 = Author.objects.create(name='J.K. Rowling')
-        self.author2 = Author.objects.create(name='George R.R. Martin')
-        
-        # Create test books
-        self.book1 = Book.objects.create(
-            title='Harry Potter and the Philosopher\'s Stone',
-            publication_year=1997,
-            author=self.author1
-        )
-        self.book2 = Book.objects.create(
-            title='Harry Potter and the Chamber of Secrets',
-            publication_year=1998,
-            author=self.author1
-        )
-        self.book3 = Book.objects.create(
-            title='A Game of Thrones',
-            publication_year=1996,
-            author=self.author2
-        )
+        # Create test authors in a single INSERT
+        cls.author1, cls.author2 = Author.objects.bulk_create([
+            Author(name='J.K. Rowling'),
+            Author(name='George R.R. Martin'),
+        ])
+        
+        # Create test books in a single INSERT
+        cls.book1, cls.book2, cls.book3 = Book.objects.bulk_create([
+            Book(
+                title='Harry Potter and the Philosopher\'s Stone',
+                publication_year=1997,
+                author=cls.author1
+            ),
+            Book(
+                title='Harry Potter and the Chamber of Secrets',
+                publication_year=1998,
+                author=cls.author1
+            ),
+            Book(
+                title='A Game of Thrones',
+                publication_year=1996,
+                author=cls.author2
+            ),
+        ])
+        
+        # Resolve per-book URLs once per class instead of in every test
+        cls.book1_detail_url = reverse('book-detail', kwargs={'pk': cls.book1.pk})
+        cls.book2_detail_url = reverse('book-detail', kwargs={'pk': cls.book2.pk})
+        cls.book1_update_url = reverse('book-update', kwargs={'pk': cls.book1.pk})
+        cls.book3_update_url = reverse('book-update', kwargs={'pk': cls.book3.pk})
+        cls.book1_delete_url = reverse('book-delete', kwargs={'pk': cls.book1.pk})
+        cls.missing_detail_url = f'{BOOK_LIST_URL}{MISSING_PK}/'
+        cls.missing_update_url = reverse('book-update', kwargs={'pk': MISSING_PK})
+        cls.missing_delete_url = reverse('book-delete', kwargs={'pk': MISSING_PK})
+    
+    def setUp(self):
+        """Set up a fresh API client and an empty cache before each test method."""
+        # Cached responses would otherwise leak between tests, since the
+        # database is rolled back after each test but the cache is not
+        cache.clear()
         
         # Initialize API client
         self.client = APIClient()
@@ -95,11 +138,11 @@ class BookAPITestCase(APITestCase):
         # (Though token auth is used in these tests, this shows the alternative)
         # self.client.login(username='testuser', password='testpass123')
     
-    def authenticate(self, token=None):
-        """Helper method to authenticate requests with a token."""
-        if token is None:
-            token = self.token
-        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token.key}')
+    def authenticate(self, auth_header=None):
+        """Helper method to authenticate requests with a preformatted token header."""
+        if auth_header is None:
+            auth_header = self.auth_header
+        self.client.credentials(HTTP_AUTHORIZATION=auth_header)
     
     def unauthenticate(self):
         """Helper method to remove authentication credentials."""
@@ -111,32 +154,108 @@ class BookListViewTests(BookAPITestCase):
     
     def test_list_books_unauthenticated(self):
         """Test that unauthenticated users can list books (public access)."""
-        url = reverse('book-list')
+        url = BOOK_LIST_URL
         response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 3)  # Should return all 3 books
+        self.assertEqual(len(response.data['results']), 3)  # Should return all 3 books
     
     def test_list_books_authenticated(self):
         """Test that authenticated users can list books."""
         self.authenticate()
-        url = reverse('book-list')
+        url = BOOK_LIST_URL
         response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 3)
+        self.assertEqual(len(response.data['results']), 3)
     
     def test_list_books_returns_correct_data(self):
         """Test that book list returns correct book data."""
-        url = reverse('book-list')
+        url = BOOK_LIST_URL
         response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
         # Check that response contains expected book titles
-        titles = [book['title'] for book in response.data]
+        titles = [book['title'] for book in response.data['results']]
         self.assertIn('Harry Potter and the Philosopher\'s Stone', titles)
         self.assertIn('A Game of Thrones', titles)
+    
+    def test_list_books_is_cursor_paginated(self):
+        """Test that the book list is wrapped in a cursor-paginated envelope."""
+        response = self.client.get(BOOK_LIST_URL)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNone(response.data['next'])
+        self.assertIsNone(response.data['previous'])
+        self.assertEqual(len(response.data['results']), 3)
+    
+    def test_list_books_pages_through_books_sharing_a_title(self):
+        """Test that books with the same title are neither skipped nor repeated across pages."""
+        Book.objects.bulk_create([
+            Book(title='Untitled', publication_year=2000, author=self.author1)
+            for _ in range(60)
+        ])
+        
+        ids = []
+        url = BOOK_LIST_URL
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids.extend(book['id'] for book in response.data['results'])
+            url = response.data['next']
+        
+        expected = list(Book.objects.order_by('title', 'id').values_list('id', flat=True))
+        self.assertEqual(ids, expected)
+    
+    def test_list_books_single_query(self):
+        """Test that listing books costs one query regardless of the number of books."""
+        with self.assertNumQueries(1):
+            response = self.client.get(BOOK_LIST_URL)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+    
+    def test_list_books_served_from_cache(self):
+        """Test that a repeated identical list request does not hit the database."""
+        self.client.get(BOOK_LIST_URL)
+        
+        with self.assertNumQueries(0):
+            response = self.client.get(BOOK_LIST_URL)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 3)
+    
+    def test_list_cache_invalidated_on_write(self):
+        """Test that creating a book through the API invalidates cached list pages."""
+        self.client.get(BOOK_LIST_URL)
+        
+        self.authenticate()
+        data = {'title': 'The Hobbit', 'publication_year': 1937, 'author': self.author1.pk}
+        self.client.post(BOOK_CREATE_URL, data, format='json')
+        response = self.client.get(BOOK_LIST_URL)
+        
+        titles = [book['title'] for book in response.data['results']]
+        self.assertIn('The Hobbit', titles)
+    
+    def test_list_books_conditional_get(self):
+        """Test that a matching If-None-Match returns 304 until the data changes."""
+        etag = self.client.get(BOOK_LIST_URL)['ETag']
+        
+        response = self.client.get(BOOK_LIST_URL, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        
+        self.authenticate()
+        self.client.patch(self.book1_update_url, {'title': 'Renamed'}, format='json')
+        response = self.client.get(BOOK_LIST_URL, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+    
+    def test_list_books_matches_serializer_output(self):
+        """Test that the plain-dict list output matches BookSerializer's output."""
+        url = BOOK_LIST_URL
+        response = self.client.get(url)
+        
+        expected = BookSerializer(Book.objects.order_by('title'), many=True).data
+        self.assertEqual(response.data['results'], expected)
 
 
 class BookDetailViewTests(BookAPITestCase):
@@ -144,16 +263,52 @@ class BookDetailViewTests(BookAPITestCase):
     
     def test_retrieve_book_unauthenticated(self):
         """Test that unauthenticated users can retrieve a single book."""
-        url = reverse('book-detail', kwargs={'pk': self.book1.pk})
+        url = self.book1_detail_url
         response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['title'], self.book1.title)
         self.assertEqual(response.data['publication_year'], self.book1.publication_year)
     
+    def test_retrieve_book_single_query(self):
+        """Test that retrieving a book loads it and its author in one query."""
+        with self.assertNumQueries(1):
+            response = self.client.get(self.book1_detail_url)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+    
+    def test_retrieve_book_conditional_get(self):
+        """Test that a matching If-None-Match on a book returns 304 without a query."""
+        etag = self.client.get(self.book1_detail_url)['ETag']
+        
+        with self.assertNumQueries(0):
+            response = self.client.get(self.book1_detail_url, HTTP_IF_NONE_MATCH=etag)
+        
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+    
+    def test_retrieve_book_cached(self):
+        """Test that a repeated retrieve is served from the cache without a query."""
+        self.client.get(self.book1_detail_url)
+        
+        with self.assertNumQueries(0):
+            response = self.client.get(self.book1_detail_url)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['title'], self.book1.title)
+    
+    def test_retrieve_book_cache_invalidated_on_update(self):
+        """Test that updating a book drops its cached copy."""
+        self.client.get(self.book1_detail_url)
+        self.authenticate()
+        self.client.patch(self.book1_update_url, {'title': 'Renamed'}, format='json')
+        
+        response = self.client.get(self.book1_detail_url)
+        
+        self.assertEqual(response.data['title'], 'Renamed')
+    
     def test_retrieve_nonexistent_book(self):
         """Test that retrieving a nonexistent book returns 404."""
-        url = reverse('book-detail', kwargs={'pk': 9999})
+        url = self.missing_detail_url
         response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -161,7 +316,7 @@ class BookDetailViewTests(BookAPITestCase):
     def test_retrieve_book_authenticated(self):
         """Test that authenticated users can retrieve a book."""
         self.authenticate()
-        url = reverse('book-detail', kwargs={'pk': self.book2.pk})
+        url = self.book2_detail_url
         response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -173,7 +328,7 @@ class BookCreateViewTests(BookAPITestCase):
     
     def test_create_book_unauthenticated(self):
         """Test that unauthenticated users cannot create books."""
-        url = reverse('book-create')
+        url = BOOK_CREATE_URL
         data = {
             'title': 'New Book',
             'publication_year': 2020,
@@ -186,7 +341,7 @@ class BookCreateViewTests(BookAPITestCase):
     def test_create_book_authenticated(self):
         """Test that authenticated users can create books."""
         self.authenticate()
-        url = reverse('book-create')
+        url = BOOK_CREATE_URL
         data = {
             'title': 'The Hobbit',
             'publication_year': 1937,
@@ -195,14 +350,14 @@ class BookCreateViewTests(BookAPITestCase):
         response = self.client.post(url, data, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        self.assertEqual(Book.objects.count(), 4)  # 3 existing + 1 new
+        self.assertTrue(Book.objects.filter(title='The Hobbit').exists())
         self.assertEqual(response.data['title'], 'The Hobbit')
         self.assertEqual(response.data['publication_year'], 1937)
     
     def test_create_book_with_future_year(self):
         """Test that creating a book with future publication year fails validation."""
         self.authenticate()
-        url = reverse('book-create')
+        url = BOOK_CREATE_URL
         data = {
             'title': 'Future Book',
             'publication_year': 2030,
@@ -216,7 +371,7 @@ class BookCreateViewTests(BookAPITestCase):
     def test_create_book_missing_required_fields(self):
         """Test that creating a book without required fields fails."""
         self.authenticate()
-        url = reverse('book-create')
+        url = BOOK_CREATE_URL
         data = {
             'title': 'Incomplete Book'
             # Missing publication_year and author
@@ -226,12 +381,49 @@ class BookCreateViewTests(BookAPITestCase):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
 
+class BookBulkCreateViewTests(BookAPITestCase):
+    """Tests for the BookBulkCreateView endpoint (POST /api/books/bulk/)"""
+    
+    def test_bulk_create_unauthenticated(self):
+        """Test that unauthenticated users cannot bulk create books."""
+        data = [{'title': 'New Book', 'publication_year': 2020, 'author': self.author1.pk}]
+        response = self.client.post(BOOK_BULK_CREATE_URL, data, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+    
+    def test_bulk_create_authenticated(self):
+        """Test that authenticated users can create several books in one INSERT."""
+        self.authenticate()
+        data = [
+            {'title': 'The Hobbit', 'publication_year': 1937, 'author': self.author1.pk},
+            {'title': 'A Clash of Kings', 'publication_year': 1998, 'author': self.author2.pk},
+        ]
+        response = self.client.post(BOOK_BULK_CREATE_URL, data, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual([book['title'] for book in response.data], ['The Hobbit', 'A Clash of Kings'])
+        self.assertTrue(all(book['id'] for book in response.data))
+        self.assertTrue(Book.objects.filter(title='A Clash of Kings').exists())
+    
+    def test_bulk_create_rejects_invalid_item(self):
+        """Test that one invalid item rejects the whole batch."""
+        self.authenticate()
+        data = [
+            {'title': 'The Hobbit', 'publication_year': 1937, 'author': self.author1.pk},
+            {'title': 'Future Book', 'publication_year': 2030, 'author': self.author1.pk},
+        ]
+        response = self.client.post(BOOK_BULK_CREATE_URL, data, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Book.objects.filter(title='The Hobbit').exists())
+
+
 class BookUpdateViewTests(BookAPITestCase):
     """Tests for the BookUpdateView endpoint (PUT/PATCH /api/books/<pk>/update/)"""
     
     def test_update_book_unauthenticated(self):
         """Test that unauthenticated users cannot update books."""
-        url = reverse('book-update', kwargs={'pk': self.book1.pk})
+        url = self.book1_update_url
         data = {'title': 'Updated Title'}
         response = self.client.patch(url, data, format='json')
         
@@ -240,7 +432,7 @@ class BookUpdateViewTests(BookAPITestCase):
     def test_partial_update_book_authenticated(self):
         """Test that authenticated users can partially update books (PATCH)."""
         self.authenticate()
-        url = reverse('book-update', kwargs={'pk': self.book1.pk})
+        url = self.book1_update_url
         data = {'title': 'Harry Potter and the Sorcerer\'s Stone'}
         response = self.client.patch(url, data, format='json')
         
@@ -253,7 +445,7 @@ class BookUpdateViewTests(BookAPITestCase):
     def test_full_update_book_authenticated(self):
         """Test that authenticated users can fully update books (PUT)."""
         self.authenticate()
-        url = reverse('book-update', kwargs={'pk': self.book3.pk})
+        url = self.book3_update_url
         data = {
             'title': 'A Clash of Kings',
             'publication_year': 1998,
@@ -269,7 +461,7 @@ class BookUpdateViewTests(BookAPITestCase):
     def test_update_nonexistent_book(self):
         """Test that updating a nonexistent book returns 404."""
         self.authenticate()
-        url = reverse('book-update', kwargs={'pk': 9999})
+        url = self.missing_update_url
         data = {'title': 'Updated Title'}
         response = self.client.patch(url, data, format='json')
         
@@ -278,7 +470,7 @@ class BookUpdateViewTests(BookAPITestCase):
     def test_update_book_with_invalid_year(self):
         """Test that updating with future year fails validation."""
         self.authenticate()
-        url = reverse('book-update', kwargs={'pk': self.book1.pk})
+        url = self.book1_update_url
         data = {'publication_year': 2030}
         response = self.client.patch(url, data, format='json')
         
@@ -290,7 +482,7 @@ class BookDeleteViewTests(BookAPITestCase):
     
     def test_delete_book_unauthenticated(self):
         """Test that unauthenticated users cannot delete books."""
-        url = reverse('book-delete', kwargs={'pk': self.book1.pk})
+        url = self.book1_delete_url
         response = self.client.delete(url)
         
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -299,17 +491,18 @@ class BookDeleteViewTests(BookAPITestCase):
     def test_delete_book_authenticated(self):
         """Test that authenticated users can delete books."""
         self.authenticate()
-        url = reverse('book-delete', kwargs={'pk': self.book1.pk})
+        url = self.book1_delete_url
         response = self.client.delete(url)
         
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertFalse(Book.objects.filter(pk=self.book1.pk).exists())
-        self.assertEqual(Book.objects.count(), 2)  # 3 - 1 deleted
+        # Other books are untouched
+        self.assertTrue(Book.objects.filter(pk=self.book2.pk).exists())
     
     def test_delete_nonexistent_book(self):
         """Test that deleting a nonexistent book returns 404."""
         self.authenticate()
-        url = reverse('book-delete', kwargs={'pk': 9999})
+        url = self.missing_delete_url
         response = self.client.delete(url)
         
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -320,53 +513,53 @@ class BookFilteringTests(BookAPITestCase):
     
     def test_filter_by_title(self):
         """Test filtering books by exact title."""
-        url = reverse('book-list')
+        url = BOOK_LIST_URL
         response = self.client.get(url, {'title': 'A Game of Thrones'})
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]['title'], 'A Game of Thrones')
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['results'][0]['title'], 'A Game of Thrones')
     
     def test_filter_by_author_name(self):
         """Test filtering books by author name."""
-        url = reverse('book-list')
+        url = BOOK_LIST_URL
         response = self.client.get(url, {'author__name': 'J.K. Rowling'})
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 2)  # Both Harry Potter books
+        self.assertEqual(len(response.data['results']), 2)  # Both Harry Potter books
         
         # Verify both books are by J.K. Rowling
-        for book in response.data:
+        for book in response.data['results']:
             self.assertEqual(book['author'], self.author1.pk)
     
     def test_filter_by_publication_year(self):
         """Test filtering books by publication year."""
-        url = reverse('book-list')
+        url = BOOK_LIST_URL
         response = self.client.get(url, {'publication_year': 1997})
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]['publication_year'], 1997)
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['results'][0]['publication_year'], 1997)
     
     def test_filter_with_no_results(self):
         """Test filtering with criteria that match no books."""
-        url = reverse('book-list')
+        url = BOOK_LIST_URL
         response = self.client.get(url, {'publication_year': 2000})
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 0)
+        self.assertEqual(len(response.data['results']), 0)
     
     def test_filter_with_multiple_parameters(self):
         """Test filtering with multiple filter parameters."""
-        url = reverse('book-list')
+        url = BOOK_LIST_URL
         response = self.client.get(url, {
             'author__name': 'J.K. Rowling',
             'publication_year': 1998
         })
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]['title'], 'Harry Potter and the Chamber of Secrets')
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['results'][0]['title'], 'Harry Potter and the Chamber of Secrets')
 
 
 class BookSearchTests(BookAPITestCase):
@@ -374,45 +567,45 @@ class BookSearchTests(BookAPITestCase):
     
     def test_search_by_title(self):
         """Test searching books by title."""
-        url = reverse('book-list')
+        url = BOOK_LIST_URL
         response = self.client.get(url, {'search': 'Harry'})
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 2)  # Both Harry Potter books
+        self.assertEqual(len(response.data['results']), 2)  # Both Harry Potter books
     
     def test_search_by_author_name(self):
         """Test searching books by author name."""
-        url = reverse('book-list')
+        url = BOOK_LIST_URL
         response = self.client.get(url, {'search': 'Martin'})
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]['title'], 'A Game of Thrones')
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['results'][0]['title'], 'A Game of Thrones')
     
     def test_search_case_insensitive(self):
         """Test that search is case-insensitive."""
-        url = reverse('book-list')
+        url = BOOK_LIST_URL
         response = self.client.get(url, {'search': 'potter'})
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 2)
+        self.assertEqual(len(response.data['results']), 2)
     
     def test_search_partial_match(self):
         """Test that search matches partial text."""
-        url = reverse('book-list')
+        url = BOOK_LIST_URL
         response = self.client.get(url, {'search': 'Chamber'})
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]['title'], 'Harry Potter and the Chamber of Secrets')
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['results'][0]['title'], 'Harry Potter and the Chamber of Secrets')
     
     def test_search_no_results(self):
         """Test search with no matching results."""
-        url = reverse('book-list')
+        url = BOOK_LIST_URL
         response = self.client.get(url, {'search': 'NonexistentBook'})
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 0)
+        self.assertEqual(len(response.data['results']), 0)
 
 
 class BookOrderingTests(BookAPITestCase):
@@ -420,52 +613,52 @@ class BookOrderingTests(BookAPITestCase):
     
     def test_order_by_title_ascending(self):
         """Test ordering books by title in ascending order."""
-        url = reverse('book-list')
+        url = BOOK_LIST_URL
         response = self.client.get(url, {'ordering': 'title'})
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        titles = [book['title'] for book in response.data]
+        titles = [book['title'] for book in response.data['results']]
         self.assertEqual(titles, sorted(titles))
         self.assertEqual(titles[0], 'A Game of Thrones')
     
     def test_order_by_title_descending(self):
         """Test ordering books by title in descending order."""
-        url = reverse('book-list')
+        url = BOOK_LIST_URL
         response = self.client.get(url, {'ordering': '-title'})
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        titles = [book['title'] for book in response.data]
+        titles = [book['title'] for book in response.data['results']]
         self.assertEqual(titles, sorted(titles, reverse=True))
         self.assertEqual(titles[0], 'Harry Potter and the Philosopher\'s Stone')
     
     def test_order_by_publication_year_ascending(self):
         """Test ordering books by publication year in ascending order."""
-        url = reverse('book-list')
+        url = BOOK_LIST_URL
         response = self.client.get(url, {'ordering': 'publication_year'})
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        years = [book['publication_year'] for book in response.data]
+        years = [book['publication_year'] for book in response.data['results']]
         self.assertEqual(years, sorted(years))
         self.assertEqual(years, [1996, 1997, 1998])
     
     def test_order_by_publication_year_descending(self):
         """Test ordering books by publication year in descending order."""
-        url = reverse('book-list')
+        url = BOOK_LIST_URL
         response = self.client.get(url, {'ordering': '-publication_year'})
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        years = [book['publication_year'] for book in response.data]
+        years = [book['publication_year'] for book in response.data['results']]
         self.assertEqual(years, sorted(years, reverse=True))
         self.assertEqual(years, [1998, 1997, 1996])
     
     def test_default_ordering(self):
         """Test that default ordering is applied when no ordering parameter is provided."""
-        url = reverse('book-list')
+        url = BOOK_LIST_URL
         response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         # Default ordering is by title (ascending)
-        titles = [book['title'] for book in response.data]
+        titles = [book['title'] for book in response.data['results']]
         self.assertEqual(titles, sorted(titles))
 
 
@@ -474,46 +667,46 @@ class CombinedQueryTests(BookAPITestCase):
     
     def test_filter_and_search(self):
         """Test combining filtering and searching."""
-        url = reverse('book-list')
+        url = BOOK_LIST_URL
         response = self.client.get(url, {
             'author__name': 'J.K. Rowling',
             'search': 'Chamber'
         })
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]['title'], 'Harry Potter and the Chamber of Secrets')
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['results'][0]['title'], 'Harry Potter and the Chamber of Secrets')
     
     def test_filter_and_ordering(self):
         """Test combining filtering and ordering."""
-        url = reverse('book-list')
+        url = BOOK_LIST_URL
         response = self.client.get(url, {
             'author__name': 'J.K. Rowling',
             'ordering': '-publication_year'
         })
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 2)
+        self.assertEqual(len(response.data['results']), 2)
         # Should be ordered by publication_year descending
-        self.assertEqual(response.data[0]['publication_year'], 1998)
-        self.assertEqual(response.data[1]['publication_year'], 1997)
+        self.assertEqual(response.data['results'][0]['publication_year'], 1998)
+        self.assertEqual(response.data['results'][1]['publication_year'], 1997)
     
     def test_search_and_ordering(self):
         """Test combining searching and ordering."""
-        url = reverse('book-list')
+        url = BOOK_LIST_URL
         response = self.client.get(url, {
             'search': 'Harry',
             'ordering': 'publication_year'
         })
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 2)
-        years = [book['publication_year'] for book in response.data]
+        self.assertEqual(len(response.data['results']), 2)
+        years = [book['publication_year'] for book in response.data['results']]
         self.assertEqual(years, [1997, 1998])
     
     def test_filter_search_and_ordering(self):
         """Test combining all three: filtering, searching, and ordering."""
-        url = reverse('book-list')
+        url = BOOK_LIST_URL
         response = self.client.get(url, {
             'author__name': 'J.K. Rowling',
             'search': 'Potter',
@@ -521,9 +714,9 @@ class CombinedQueryTests(BookAPITestCase):
         })
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 2)
+        self.assertEqual(len(response.data['results']), 2)
         # Should be ordered by title descending
-        titles = [book['title'] for book in response.data]
+        titles = [book['title'] for book in response.data['results']]
         self.assertEqual(titles[0], 'Harry Potter and the Philosopher\'s Stone')
 
 
@@ -538,54 +731,54 @@ class PermissionTests(BookAPITestCase):
         
         # Now use token auth for the actual API call
         self.authenticate()
-        url = reverse('book-create')
+        url = BOOK_CREATE_URL
         data = {'title': 'Session Auth Test', 'publication_year': 2020, 'author': self.author1.pk}
         response = self.client.post(url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
     
     def test_list_requires_no_authentication(self):
         """Test that listing books doesn't require authentication."""
-        url = reverse('book-list')
+        url = BOOK_LIST_URL
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
     
     def test_detail_requires_no_authentication(self):
         """Test that retrieving a book doesn't require authentication."""
-        url = reverse('book-detail', kwargs={'pk': self.book1.pk})
+        url = self.book1_detail_url
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
     
     def test_create_requires_authentication(self):
         """Test that creating a book requires authentication."""
-        url = reverse('book-create')
+        url = BOOK_CREATE_URL
         data = {'title': 'Test', 'publication_year': 2020, 'author': self.author1.pk}
         response = self.client.post(url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
     
     def test_update_requires_authentication(self):
         """Test that updating a book requires authentication."""
-        url = reverse('book-update', kwargs={'pk': self.book1.pk})
+        url = self.book1_update_url
         data = {'title': 'Updated'}
         response = self.client.patch(url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
     
     def test_delete_requires_authentication(self):
         """Test that deleting a book requires authentication."""
-        url = reverse('book-delete', kwargs={'pk': self.book1.pk})
+        url = self.book1_delete_url
         response = self.client.delete(url)
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
     
     def test_different_user_can_modify_books(self):
         """Test that any authenticated user can modify books (no ownership restriction)."""
         # Create book as user 1
-        self.authenticate(self.token)
-        url = reverse('book-create')
+        self.authenticate(self.auth_header)
+        url = BOOK_CREATE_URL
         data = {'title': 'User1 Book', 'publication_year': 2020, 'author': self.author1.pk}
         response = self.client.post(url, data, format='json')
         book_id = response.data['id']
         
         # Update as user 2
-        self.authenticate(self.other_token)
+        self.authenticate(self.other_auth_header)
         url = reverse('book-update', kwargs={'pk': book_id})
         data = {'title': 'Modified by User2'}
         response = self.client.patch(url, data, format='json')
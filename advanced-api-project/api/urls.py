@@ -8,6 +8,7 @@ URL Patterns:
 - /books/ - List all books (GET) - Public access
 - /books/<int:pk>/ - Retrieve a single book (GET) - Public access
 - /books/create/ - Create a new book (POST) - Authenticated users only
+- /books/bulk/ - Create many books in one request (POST) - Authenticated users only
 - /books/<int:pk>/update/ - Update a book (PUT/PATCH) - Authenticated users only
 - /books/<int:pk>/delete/ - Delete a book (DELETE) - Authenticated users only
 """
@@ -17,6 +18,7 @@ from .views import (
     BookListView,
     BookDetailView,
     BookCreateView,
+    BookBulkCreateView,
     BookUpdateView,
     BookDeleteView
 )
@@ -31,6 +33,9 @@ urlpatterns = [
     # Create a new book - Requires authentication
     path('books/create/', BookCreateView.as_view(), name='book-create'),
     
+    # Create many books in one request - Requires authentication
+    path('books/bulk/', BookBulkCreateView.as_view(), name='book-bulk-create'),
+    
     # Update an existing book - Requires authentication
     path('books/update/<int:pk>/', BookUpdateView.as_view(), name='book-update'),
     path('books/<int:pk>/update/', BookUpdateView.as_view(), name='book-update-alt'),
@@ -1,12 +1,53 @@
 from django.shortcuts import render
 from rest_framework import generics, permissions, filters
 from rest_framework.permissions import IsAuthenticatedOrReadOnly, IsAuthenticated
+from rest_framework.response import Response
 from django_filters import rest_framework
+from django.core.cache import cache
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
+from .cache import (
+    BOOK_CACHE_TIMEOUT,
+    book_data_version,
+    book_detail_cache_key,
+    book_list_cache_key,
+    invalidate_book_list_cache,
+)
+from .filters import BookFilter
+from .pagination import BookCursorPagination
 from .models import Book
 from .serializers import BookSerializer
 
 # Create your views here.
 
+def book_list_etag(request, *args, **kwargs):
+    """ETag for the book list; changes whenever any book or author is written."""
+    return book_data_version()
+
+
+def book_detail_etag(request, *args, **kwargs):
+    """ETag for a single book; changes whenever any book or author is written."""
+    return f"{book_data_version()}-{kwargs['pk']}"
+
+
+class EagerLoadingMixin:
+    """
+    Apply the serializer's eager loading to the view's queryset.
+    
+    Serializers that expose related data declare a setup_eager_loading(queryset)
+    classmethod naming the select_related/prefetch_related calls their fields
+    need. Views using this mixin pick that up automatically, so querysets stay
+    in step with the serializer instead of being maintained by hand per view.
+    """
+    
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        setup_eager_loading = getattr(self.get_serializer_class(), 'setup_eager_loading', None)
+        if setup_eager_loading is not None:
+            queryset = setup_eager_loading(queryset)
+        return queryset
+
+
 class BookListView(generics.ListAPIView):
     """
     API view to retrieve a list of all books with filtering, searching, and ordering.
@@ -27,28 +68,67 @@ class BookListView(generics.ListAPIView):
     
     - Ordering: Sort results by title or publication_year
       Example: /api/books/?ordering=title or /api/books/?ordering=-publication_year
+    
+    - Pagination: Results are cursor-paginated, 50 per page; follow the
+      'next' and 'previous' links in the response to move between pages
     """
     queryset = Book.objects.all()
     serializer_class = BookSerializer
     permission_classes = [permissions.AllowAny]  # Public read access
     
+    # Bound each response to one page of results
+    pagination_class = BookCursorPagination
+    
     # Enable filtering, searching, and ordering
     filter_backends = [rest_framework.DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     
-    # Specify fields that can be filtered
-    filterset_fields = ['title', 'author__name', 'publication_year']
+    # Fields that can be filtered (title, author__name, publication_year)
+    filterset_class = BookFilter
     
     # Specify fields that can be searched
     search_fields = ['title', 'author__name']
     
     # Specify fields that can be used for ordering
+    # (default ordering by title comes from Book.Meta.ordering)
     ordering_fields = ['title', 'publication_year']
     
-    # Default ordering
-    ordering = ['title']
+    def get_queryset(self):
+        """
+        Return books as plain dicts of the BookSerializer fields.
+        
+        values() skips building a Book instance per row; the author key holds
+        the author's primary key, exactly as BookSerializer outputs it.
+        """
+        return super().get_queryset().values(*BookSerializer.Meta.fields)
+    
+    @method_decorator(condition(etag_func=book_list_etag))
+    def list(self, request, *args, **kwargs):
+        """
+        List books straight from the values() rows, without running them
+        through a serializer, since this path is read-only.
+        
+        Each page is cached per URL, so repeated identical requests skip the
+        database; any book or author write invalidates the cache. Clients
+        sending a matching If-None-Match get 304 Not Modified with no body.
+        """
+        cache_key = book_list_cache_key(request.build_absolute_uri())
+        data = cache.get(cache_key)
+        if data is not None:
+            return Response(data)
+        
+        queryset = self.filter_queryset(self.get_queryset())
+        
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            response = self.get_paginated_response(list(page))
+        else:
+            response = Response(list(queryset))
+        
+        cache.set(cache_key, response.data, BOOK_CACHE_TIMEOUT)
+        return response
 
 
-class BookDetailView(generics.RetrieveAPIView):
+class BookDetailView(EagerLoadingMixin, generics.RetrieveAPIView):
     """
     API view to retrieve a single book by ID.
     
@@ -62,6 +142,31 @@ class BookDetailView(generics.RetrieveAPIView):
     queryset = Book.objects.all()
     serializer_class = BookSerializer
     permission_classes = [permissions.AllowAny]  # Public read access
+    
+    def get_object(self):
+        """
+        Return the requested book, served from the cache when possible.
+        
+        Cached copies are dropped by the signal receivers in models.py when
+        the book is saved or deleted. Object permissions are still checked on
+        cache hits.
+        """
+        cache_key = book_detail_cache_key(self.kwargs[self.lookup_field])
+        book = cache.get(cache_key)
+        if book is None:
+            book = super().get_object()
+            cache.set(cache_key, book, BOOK_CACHE_TIMEOUT)
+        else:
+            self.check_object_permissions(self.request, book)
+        return book
+    
+    @method_decorator(condition(etag_func=book_detail_etag))
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Retrieve a book, answering 304 Not Modified without touching the
+        database when the client's If-None-Match ETag is still current.
+        """
+        return super().retrieve(request, *args, **kwargs)
 
 
 class BookCreateView(generics.CreateAPIView):
@@ -94,7 +199,43 @@ class BookCreateView(generics.CreateAPIView):
         serializer.save()
 
 
-class BookUpdateView(generics.UpdateAPIView):
+class BookBulkCreateView(generics.CreateAPIView):
+    """
+    API view to create many books in one request.
+    
+    - Endpoint: POST /books/bulk/
+    - Permissions: Requires authentication
+    - Request Body: JSON list of objects with title, publication_year, and author fields
+    - Returns: The list of newly created Book instances
+    
+    Every item is validated by BookSerializer (including the publication_year
+    check); if any item is invalid nothing is created. Valid input is written
+    with bulk_create, so N books cost a single INSERT instead of N.
+    """
+    queryset = Book.objects.all()
+    serializer_class = BookSerializer
+    permission_classes = [IsAuthenticated]  # Requires authentication
+    
+    def get_serializer(self, *args, **kwargs):
+        """Accept a list of books rather than a single object."""
+        kwargs['many'] = True
+        return super().get_serializer(*args, **kwargs)
+    
+    def perform_create(self, serializer):
+        """
+        Insert all validated books with one bulk_create.
+        
+        bulk_create does not send post_save signals, so the cached book list
+        pages are invalidated here explicitly.
+        """
+        serializer.instance = Book.objects.bulk_create(
+            [Book(**data) for data in serializer.validated_data],
+            batch_size=500,
+        )
+        invalidate_book_list_cache()
+
+
+class BookUpdateView(EagerLoadingMixin, generics.UpdateAPIView):
     """
     API view to update an existing book.
     
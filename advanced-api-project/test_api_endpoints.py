@@ -3,9 +3,15 @@
 
 import requests
 import json
+from requests.adapters import HTTPAdapter
 
 BASE_URL = 'http://127.0.0.1:8001/api'
 
+# One keep-alive session for all requests, so the checks below reuse a single
+# connection instead of opening a new one per request
+session = requests.Session()
+session.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
 print("=" * 60)
 print("Testing Advanced API Project Endpoints")
 print("=" * 60)
@@ -13,12 +19,13 @@ print("=" * 60)
 # Test 1: List all books (Public - should work)
 print("\n1. Testing GET /api/books/ (Public access)")
 try:
-    response = requests.get(f'{BASE_URL}/books/')
+    response = session.get(f'{BASE_URL}/books/')
     print(f"   Status Code: {response.status_code}")
     if response.status_code == 200:
-        print(f"   ✓ Success! Found {len(response.json())} books")
-        if response.json():
-            print(f"   Sample: {response.json()[0]}")
+        books = response.json()['results']  # List is cursor-paginated
+        print(f"   ✓ Success! Found {len(books)} books on the first page")
+        if books:
+            print(f"   Sample: {books[0]}")
     else:
         print(f"   ✗ Failed: {response.text}")
 except Exception as e:
@@ -27,7 +34,7 @@ except Exception as e:
 # Test 2: Get single book (Public - should work if books exist)
 print("\n2. Testing GET /api/books/1/ (Public access)")
 try:
-    response = requests.get(f'{BASE_URL}/books/1/')
+    response = session.get(f'{BASE_URL}/books/1/')
     print(f"   Status Code: {response.status_code}")
     if response.status_code == 200:
         print(f"   ✓ Success! Book: {response.json()}")
@@ -46,7 +53,7 @@ try:
         "publication_year": 2024,
         "author": 1
     }
-    response = requests.post(
+    response = session.post(
         f'{BASE_URL}/books/create/',
         json=data,
         headers={'Content-Type': 'application/json'}
@@ -63,7 +70,7 @@ except Exception as e:
 print("\n4. Testing PATCH /api/books/1/update/ (Without authentication)")
 try:
     data = {"title": "Unauthorized Update"}
-    response = requests.patch(
+    response = session.patch(
         f'{BASE_URL}/books/1/update/',
         json=data,
         headers={'Content-Type': 'application/json'}
@@ -79,7 +86,7 @@ except Exception as e:
 # Test 5: Try to delete book without auth (Should fail)
 print("\n5. Testing DELETE /api/books/1/delete/ (Without authentication)")
 try:
-    response = requests.delete(f'{BASE_URL}/books/1/delete/')
+    response = session.delete(f'{BASE_URL}/books/1/delete/')
     print(f"   Status Code: {response.status_code}")
     if response.status_code in [401, 403]:
         print(f"   ✓ Correctly blocked! Authentication required")
@@ -88,6 +95,8 @@ try:
 except Exception as e:
     print(f"   ✗ Error: {e}")
 
+session.close()
+
 print("\n" + "=" * 60)
 print("Testing Summary:")
 print("  - Public endpoints (GET /books/, /books/1/) accessible ✓")
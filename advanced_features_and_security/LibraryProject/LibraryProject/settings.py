@@ -1,5 +1,5 @@
-# If behind a proxy/load balancer, ensure Django knows to trust X-Forwarded-Proto for HTTPS
-SECURE_PROXY_SSL_HEADER = ('HTTP_X_FORWARDED_PROTO', 'https')
+import os
+from importlib.util import find_spec
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -15,15 +15,15 @@ SECURE_HSTS_INCLUDE_SUBDOMAINS = True  # Apply HSTS to all subdomains
 SECURE_HSTS_PRELOAD = True  # Allow site to be preloaded in browsers
 SESSION_COOKIE_SECURE = True  # Only send session cookie over HTTPS
 CSRF_COOKIE_SECURE = True  # Only send CSRF cookie over HTTPS
+# If behind a proxy/load balancer, ensure Django knows to trust X-Forwarded-Proto for HTTPS
+SECURE_PROXY_SSL_HEADER = ('HTTP_X_FORWARDED_PROTO', 'https')
 
 # Secure headers
 SECURE_BROWSER_XSS_FILTER = True  # Enable browser XSS filter
 X_FRAME_OPTIONS = 'DENY'  # Prevent clickjacking
 SECURE_CONTENT_TYPE_NOSNIFF = True  # Prevent MIME type sniffing
 
-# Content Security Policy settings (requires django-csp)
-# Add 'csp.middleware.CSPMiddleware' to MIDDLEWARE if using django-csp
-# MIDDLEWARE = ['csp.middleware.CSPMiddleware', ...existing middleware...]
+# Content Security Policy settings (read by django-csp<4's CSPMiddleware)
 CSP_DEFAULT_SRC = ("'self'",)
 CSP_SCRIPT_SRC = ("'self'",)
 CSP_STYLE_SRC = ("'self'",)
@@ -45,6 +45,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'csp.middleware.CSPMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -61,6 +62,8 @@ TEMPLATES = [
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [],
         'APP_DIRS': True,
+        # No 'loaders' option: Django (4.1+) then wraps these loaders in the cached
+        # loader, so templates are compiled once per process
         'OPTIONS': {
             'context_processors': [
                 'django.template.context_processors.debug',
@@ -74,12 +77,36 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'LibraryProject.wsgi.application'
 
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+# Database
+# Defaults to SQLite for local development. Set DB_ENGINE=django.db.backends.postgresql
+# (plus DB_NAME, DB_USER, DB_PASSWORD, DB_HOST, DB_PORT) in production.
+DB_ENGINE = os.environ.get('DB_ENGINE', 'django.db.backends.sqlite3')
+
+if DB_ENGINE == 'django.db.backends.postgresql':
+    DATABASES = {
+        'default': {
+            'ENGINE': DB_ENGINE,
+            'NAME': os.environ.get('DB_NAME', 'library'),
+            'USER': os.environ.get('DB_USER', ''),
+            'PASSWORD': os.environ.get('DB_PASSWORD', ''),
+            'HOST': os.environ.get('DB_HOST', 'localhost'),
+            'PORT': os.environ.get('DB_PORT', '5432'),
+            # Keep connections open between requests instead of reconnecting each time
+            'CONN_MAX_AGE': 600,
+            'CONN_HEALTH_CHECKS': True,
+        }
+    }
+    # Server-side parameter binding lets Postgres reuse query plans. Only the
+    # psycopg 3 driver accepts it; psycopg2 would fail to connect.
+    if find_spec('psycopg') is not None:
+        DATABASES['default']['OPTIONS'] = {'server_side_binding': True}
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': DB_ENGINE,
+            'NAME': BASE_DIR / 'db.sqlite3',
+        }
     }
-}
 
 AUTH_PASSWORD_VALIDATORS = [
     {
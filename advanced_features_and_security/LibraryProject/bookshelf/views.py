@@ -1,3 +1,6 @@
+import csv
+
+from django.http import Http404, StreamingHttpResponse
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth.decorators import permission_required
 from .models import Book
@@ -24,24 +27,56 @@ def create_book(request):
 # Edit a book (requires can_edit permission)
 @permission_required('bookshelf.can_edit', raise_exception=True)
 def edit_book(request, pk):
-    book = get_object_or_404(Book, pk=pk)
     if request.method == 'POST':
-        book.title = request.POST.get('title', book.title)
-        book.author = request.POST.get('author', book.author)
-        book.published_date = request.POST.get('published_date', book.published_date)
-        book.save()
+        # Update only the submitted fields in a single UPDATE, without loading the row first
+        fields = {
+            name: request.POST[name]
+            for name in ('title', 'author', 'published_date')
+            if name in request.POST
+        }
+        books = Book.objects.filter(pk=pk)
+        found = books.update(**fields) if fields else books.exists()
+        if not found:
+            raise Http404('No Book matches the given query.')
         return redirect('view_books')
+    book = get_object_or_404(Book, pk=pk)
     return render(request, 'bookshelf/edit_book.html', {'book': book})
 
 # Delete a book (requires can_delete permission)
 @permission_required('bookshelf.can_delete', raise_exception=True)
 def delete_book(request, pk):
-    book = get_object_or_404(Book, pk=pk)
     if request.method == 'POST':
-        book.delete()
+        # Delete in a single DELETE, without loading the row first
+        deleted, _ = Book.objects.filter(pk=pk).delete()
+        if not deleted:
+            raise Http404('No Book matches the given query.')
         return redirect('view_books')
+    book = get_object_or_404(Book, pk=pk)
     return render(request, 'bookshelf/delete_book.html', {'book': book})
 
+class _Echo:
+    """File-like object whose write() returns the value, for csv.writer."""
+
+    def write(self, value):
+        return value
+
+# Export all books as CSV (requires can_view permission)
+@permission_required('bookshelf.can_view', raise_exception=True)
+def export_books(request):
+    # Stream rows as they are read, so memory stays flat however large the table is
+    fields = ('title', 'author', 'published_date')
+    books = Book.objects.values_list(*fields).iterator(chunk_size=2000)
+    writer = csv.writer(_Echo())
+
+    def rows():
+        yield writer.writerow(fields)
+        for book in books:
+            yield writer.writerow(book)
+
+    response = StreamingHttpResponse(rows(), content_type='text/csv')
+    response['Content-Disposition'] = 'attachment; filename="books.csv"'
+    return response
+
 # Documentation note:
 # To set up groups and assign permissions, use Django admin:
 # 1. Create groups: Editors, Viewers, Admins
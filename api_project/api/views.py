@@ -1,6 +1,7 @@
 from django.shortcuts import render
 from rest_framework import generics, viewsets
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
+from rest_framework.response import Response
 from .models import Book
 from .serializers import BookSerializer
 
@@ -15,6 +16,15 @@ class BookList(generics.ListAPIView):
     serializer_class = BookSerializer
     permission_classes = [IsAuthenticated]  # Only authenticated users can access
 
+    def list(self, request, *args, **kwargs):
+        """
+        Return books as plain dicts straight from values(), skipping a Book
+        instance and a serializer pass per row. Book has only scalar fields,
+        so the output matches BookSerializer.
+        """
+        books = self.filter_queryset(self.get_queryset()).values('id', 'title', 'author')
+        return Response(list(books))
+
 class BookViewSet(viewsets.ModelViewSet):
     """
     ViewSet for performing CRUD operations on Book model.
@@ -1,7 +1,10 @@
-from django.contrib.auth.decorators import permission_required
+from django.contrib.auth import login
+from django.contrib.auth.decorators import permission_required, user_passes_test
+from django.contrib.auth.forms import UserCreationForm
 from django.http import HttpResponseForbidden
-from django.shortcuts import get_object_or_404
-from .models import Book
+from django.shortcuts import get_object_or_404, redirect, render
+from django.views.generic.detail import DetailView
+from .models import Library, Book
 
 # Add Book view
 @permission_required('relationship_app.can_add_book', raise_exception=True)
@@ -32,12 +35,6 @@ def delete_book(request, pk):
         book.delete()
         return redirect('list_books')
     return render(request, 'relationship_app/delete_book.html', {'book': book})
-from django.contrib.auth.decorators import user_passes_test
-from django.shortcuts import render, redirect
-from django.views.generic.detail import DetailView
-from .models import Library, Book
-from django.contrib.auth.forms import UserCreationForm
-from django.contrib.auth import login
 
 # Existing views
 def list_books(request):
@@ -1,4 +1,5 @@
 from django import forms
+from django.contrib.auth import password_validation
 from django.contrib.auth.forms import UserCreationForm
 from django.contrib.auth.models import User
 from taggit.forms import TagWidget
@@ -12,6 +13,27 @@ class CustomUserCreationForm(UserCreationForm):
         help_text='Required. Enter a valid email address.',
         widget=forms.EmailInput(attrs={'class': 'form-control', 'placeholder': 'Email'})
     )
+    # Same as UserCreationForm's password fields, with the form styling declared up front
+    password1 = forms.CharField(
+        label='Password',
+        strip=False,
+        widget=forms.PasswordInput(attrs={
+            'autocomplete': 'new-password',
+            'class': 'form-control',
+            'placeholder': 'Password',
+        }),
+        help_text=password_validation.password_validators_help_text_html(),
+    )
+    password2 = forms.CharField(
+        label='Password confirmation',
+        strip=False,
+        widget=forms.PasswordInput(attrs={
+            'autocomplete': 'new-password',
+            'class': 'form-control',
+            'placeholder': 'Confirm Password',
+        }),
+        help_text='Enter the same password as before, for verification.',
+    )
 
     class Meta:
         model = User
@@ -20,11 +42,6 @@ class CustomUserCreationForm(UserCreationForm):
             'username': forms.TextInput(attrs={'class': 'form-control', 'placeholder': 'Username'}),
         }
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.fields['password1'].widget.attrs.update({'class': 'form-control', 'placeholder': 'Password'})
-        self.fields['password2'].widget.attrs.update({'class': 'form-control', 'placeholder': 'Confirm Password'})
-
     def save(self, commit=True):
         user = super().save(commit=False)
         user.email = self.cleaned_data['email']
@@ -80,17 +97,17 @@ class PostForm(forms.ModelForm):
     
     def clean_title(self):
         """Validate that the title is not empty or just whitespace."""
-        title = self.cleaned_data.get('title')
-        if not title or not title.strip():
+        title = (self.cleaned_data.get('title') or '').strip()
+        if not title:
             raise forms.ValidationError('Title cannot be empty.')
-        return title.strip()
+        return title
     
     def clean_content(self):
         """Validate that the content is not empty or just whitespace."""
-        content = self.cleaned_data.get('content')
-        if not content or not content.strip():
+        content = (self.cleaned_data.get('content') or '').strip()
+        if not content:
             raise forms.ValidationError('Content cannot be empty.')
-        return content.strip()
+        return content
 
 
 class CommentForm(forms.ModelForm):
@@ -115,9 +132,9 @@ class CommentForm(forms.ModelForm):
     
     def clean_content(self):
         """Validate that the comment content is not empty or just whitespace."""
-        content = self.cleaned_data.get('content')
-        if not content or not content.strip():
+        content = (self.cleaned_data.get('content') or '').strip()
+        if not content:
             raise forms.ValidationError('Comment cannot be empty.')
-        if len(content.strip()) < 3:
+        if len(content) < 3:
             raise forms.ValidationError('Comment must be at least 3 characters long.')
-        return content.strip()
+        return content
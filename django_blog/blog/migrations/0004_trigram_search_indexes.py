@@ -0,0 +1,40 @@
+from django.db import migrations
+
+
+# search_posts matches with icontains, which Django compiles on PostgreSQL to
+# UPPER(column) LIKE UPPER(%s). Trigram GIN indexes on UPPER(column) let those
+# '%query%' patterns use an index instead of scanning every post and tag.
+TRIGRAM_INDEXES = [
+    ('blog_post_title_trgm', 'blog_post', 'title'),
+    ('blog_post_content_trgm', 'blog_post', 'content'),
+    ('taggit_tag_name_trgm', 'taggit_tag', 'name'),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for index_name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {index_name} ON {table} '
+            f'USING gin (UPPER({column}::text) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for index_name, _table, _column in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {index_name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0003_post_tags'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -32,3 +32,7 @@ class Comment(models.Model):
     
     class Meta:
         ordering = ['created_at']
+        indexes = [
+            # A post's comments are always listed in created_at order
+            models.Index(fields=['post', 'created_at'], name='blog_comment_post_created_idx'),
+        ]
@@ -7,7 +7,8 @@ urlpatterns = [
     path('', views.home, name='blog-home'),
     
     # Blog post CRUD operations
-    path('posts/', views.PostListView.as_view(), name='post-list'),
+    # Anonymous visitors get the list from the cache for up to 60 seconds
+    path('posts/', views.cache_page_for_anonymous(60)(views.PostListView.as_view()), name='post-list'),
     path('post/<int:pk>/', views.PostDetailView.as_view(), name='post-detail'),
     path('post/new/', views.PostCreateView.as_view(), name='post-create'),
     path('post/<int:pk>/update/', views.PostUpdateView.as_view(), name='post-update'),
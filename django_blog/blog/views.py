@@ -1,19 +1,44 @@
-from django.shortcuts import render, redirect, get_object_or_404
-from django.contrib.auth import login, logout, authenticate
+from functools import wraps
+
+from django.http import Http404
+from django.shortcuts import render, redirect
+from django.contrib.auth import login
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 from django.contrib import messages
 from django.views.generic import ListView, DetailView, CreateView, UpdateView, DeleteView
-from django.urls import reverse_lazy
+from django.urls import reverse, reverse_lazy
+from django.views.decorators.cache import cache_page
 from django.db.models import Q
 from .models import Post, Comment
 from .forms import CustomUserCreationForm, UserUpdateForm, CommentForm, PostForm
 
 # Create your views here.
 
+def cache_page_for_anonymous(timeout):
+    """
+    Like cache_page, but only for visitors who are not logged in.
+    
+    Anonymous visitors all see the same page, so it is served from the cache
+    for `timeout` seconds. Logged-in users always get a freshly rendered page,
+    since it includes their own edit/delete links and new posts.
+    """
+    def decorator(view):
+        cached_view = cache_page(timeout)(view)
+        
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if request.user.is_authenticated:
+                return view(request, *args, **kwargs)
+            return cached_view(request, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
 def home(request):
     """Display all blog posts on the home page."""
-    posts = Post.objects.all()
+    # Join the author in the same query, since the template shows each post's author
+    posts = Post.objects.select_related('author')
     context = {
         'posts': posts
     }
@@ -22,6 +47,20 @@ def home(request):
 
 # Class-based views for Post CRUD operations
 
+class CachedObjectMixin:
+    """
+    Fetch the view's object once per request.
+    
+    UserPassesTestMixin calls get_object() from test_func() before the view
+    itself fetches the object again; this keeps the first result.
+    """
+    
+    def get_object(self, queryset=None):
+        if not hasattr(self, '_object'):
+            self._object = super().get_object(queryset)
+        return self._object
+
+
 class PostListView(ListView):
     """Display all blog posts in a paginated list."""
     model = Post
@@ -29,6 +68,10 @@ class PostListView(ListView):
     context_object_name = 'posts'
     ordering = ['-published_date']
     paginate_by = 10
+    
+    def get_queryset(self):
+        """Load each post's author and tags up front to avoid a query per post."""
+        return super().get_queryset().select_related('author').prefetch_related('tags')
 
 
 class PostDetailView(DetailView):
@@ -37,10 +80,15 @@ class PostDetailView(DetailView):
     template_name = 'blog/post_detail.html'
     context_object_name = 'post'
     
+    def get_queryset(self):
+        """Load the post's author with it, and its tags in one more query."""
+        return super().get_queryset().select_related('author').prefetch_related('tags')
+    
     def get_context_data(self, **kwargs):
         """Add comments and comment form to the context."""
         context = super().get_context_data(**kwargs)
-        context['comments'] = self.object.comments.all()
+        # Join each comment's author rather than fetching it per comment
+        context['comments'] = self.object.comments.select_related('author')
         context['comment_form'] = CommentForm()
         return context
 
@@ -59,10 +107,10 @@ class PostCreateView(LoginRequiredMixin, CreateView):
     
     def get_success_url(self):
         """Redirect to the newly created post detail page."""
-        return reverse_lazy('post-detail', kwargs={'pk': self.object.pk})
+        return reverse('post-detail', kwargs={'pk': self.object.pk})
 
 
-class PostUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
+class PostUpdateView(LoginRequiredMixin, UserPassesTestMixin, CachedObjectMixin, UpdateView):
     """Allow post authors to edit their own posts."""
     model = Post
     form_class = PostForm
@@ -77,14 +125,14 @@ class PostUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
     def test_func(self):
         """Check if the current user is the author of the post."""
         post = self.get_object()
-        return self.request.user == post.author
+        return self.request.user.pk == post.author_id
     
     def get_success_url(self):
         """Redirect to the updated post detail page."""
-        return reverse_lazy('post-detail', kwargs={'pk': self.object.pk})
+        return reverse('post-detail', kwargs={'pk': self.object.pk})
 
 
-class PostDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
+class PostDeleteView(LoginRequiredMixin, UserPassesTestMixin, CachedObjectMixin, DeleteView):
     """Allow post authors to delete their own posts."""
     model = Post
     template_name = 'blog/post_confirm_delete.html'
@@ -93,7 +141,7 @@ class PostDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
     def test_func(self):
         """Check if the current user is the author of the post."""
         post = self.get_object()
-        return self.request.user == post.author
+        return self.request.user.pk == post.author_id
     
     def delete(self, request, *args, **kwargs):
         """Add success message when post is deleted."""
@@ -108,8 +156,10 @@ def register(request):
         form = CustomUserCreationForm(request.POST)
         if form.is_valid():
             user = form.save()
-            username = form.cleaned_data.get('username')
-            messages.success(request, f'Account created successfully for {username}! You can now log in.')
+            # Script clients never render the next page, so don't queue a message for them
+            if request.headers.get('X-Requested-With') != 'XMLHttpRequest':
+                username = form.cleaned_data.get('username')
+                messages.success(request, f'Account created successfully for {username}! You can now log in.')
             login(request, user)
             return redirect('blog-home')
         else:
@@ -151,16 +201,19 @@ class CommentCreateView(LoginRequiredMixin, CreateView):
     def form_valid(self, form):
         """Set the comment author and associated post."""
         form.instance.author = self.request.user
-        form.instance.post = get_object_or_404(Post, pk=self.kwargs['pk'])
+        # Only check that the post exists; its row (and content) is not needed
+        if not Post.objects.filter(pk=self.kwargs['pk']).exists():
+            raise Http404('No Post matches the given query.')
+        form.instance.post_id = self.kwargs['pk']
         messages.success(self.request, 'Your comment has been posted successfully!')
         return super().form_valid(form)
     
     def get_success_url(self):
         """Redirect back to the post detail page."""
-        return reverse_lazy('post-detail', kwargs={'pk': self.kwargs['pk']})
+        return reverse('post-detail', kwargs={'pk': self.kwargs['pk']})
 
 
-class CommentUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
+class CommentUpdateView(LoginRequiredMixin, UserPassesTestMixin, CachedObjectMixin, UpdateView):
     """Allow comment authors to edit their own comments."""
     model = Comment
     form_class = CommentForm
@@ -174,15 +227,14 @@ class CommentUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
     def test_func(self):
         """Check if the current user is the author of the comment."""
         comment = self.get_object()
-        return self.request.user == comment.author
+        return self.request.user.pk == comment.author_id
     
     def get_success_url(self):
         """Redirect back to the post detail page."""
-        comment = self.get_object()
-        return reverse_lazy('post-detail', kwargs={'pk': comment.post.pk})
+        return reverse('post-detail', kwargs={'pk': self.object.post_id})
 
 
-class CommentDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
+class CommentDeleteView(LoginRequiredMixin, UserPassesTestMixin, CachedObjectMixin, DeleteView):
     """Allow comment authors to delete their own comments."""
     model = Comment
     template_name = 'blog/comment_confirm_delete.html'
@@ -190,7 +242,7 @@ class CommentDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
     def test_func(self):
         """Check if the current user is the author of the comment."""
         comment = self.get_object()
-        return self.request.user == comment.author
+        return self.request.user.pk == comment.author_id
     
     def delete(self, request, *args, **kwargs):
         """Add success message when comment is deleted."""
@@ -199,8 +251,7 @@ class CommentDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
     
     def get_success_url(self):
         """Redirect back to the post detail page."""
-        comment = self.get_object()
-        return reverse_lazy('post-detail', kwargs={'pk': comment.post.pk})
+        return reverse('post-detail', kwargs={'pk': self.object.post_id})
 
 
 # Search and Tag views
@@ -208,20 +259,26 @@ class CommentDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
 def search_posts(request):
     """Search for posts by title, content, or tags."""
     query = request.GET.get('q', '')
-    results = Post.objects.none()
+    results = []
     
     if query:
         # Use Q objects to search across multiple fields
-        results = Post.objects.filter(
-            Q(title__icontains=query) |
-            Q(content__icontains=query) |
-            Q(tags__name__icontains=query)
-        ).distinct()
+        # Evaluate once into a list so the count below needs no extra COUNT query
+        results = list(
+            Post.objects.filter(
+                Q(title__icontains=query) |
+                Q(content__icontains=query) |
+                Q(tags__name__icontains=query)
+            )
+            .distinct()
+            .select_related('author')
+            .prefetch_related('tags')
+        )
     
     context = {
         'query': query,
         'results': results,
-        'count': results.count()
+        'count': len(results)
     }
     return render(request, 'blog/search_results.html', context)
 
@@ -236,7 +293,11 @@ class PostByTagListView(ListView):
     def get_queryset(self):
         """Filter posts by the tag slug from the URL."""
         tag_slug = self.kwargs.get('tag_slug')
-        return Post.objects.filter(tags__slug=tag_slug)
+        return (
+            Post.objects.filter(tags__slug=tag_slug)
+            .select_related('author')
+            .prefetch_related('tags')
+        )
     
     def get_context_data(self, **kwargs):
         """Add the tag name to the context."""
@@ -0,0 +1,24 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    Add a (to_customuser_id, from_customuser_id) index on the followers table.
+    
+    The table's unique (from_customuser_id, to_customuser_id) index already
+    covers "who does X follow" lookups. This is the mirror image for
+    "who follows X" (user.following, the feed and following counts), so those
+    can be answered from the index alone without visiting table rows.
+    """
+
+    dependencies = [
+        ('accounts', '0002_customuser_accounts_user_email_upper_idx'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            'CREATE INDEX accounts_followers_to_from_idx '
+            'ON accounts_customuser_followers (to_customuser_id, from_customuser_id)',
+            'DROP INDEX accounts_followers_to_from_idx',
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-15 05:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_followers_to_from_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='customuser',
+            name='unread_notifications',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Number of notifications this user has not read yet'),
+        ),
+    ]
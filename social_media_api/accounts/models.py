@@ -1,5 +1,6 @@
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.db.models.functions import Upper
 
 
 class CustomUser(AbstractUser):
@@ -25,6 +26,12 @@ class CustomUser(AbstractUser):
         blank=True,
         help_text='Users who follow this user'
     )
+    # Maintained by the notifications app so the unread badge is a column read
+    unread_notifications = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text='Number of notifications this user has not read yet'
+    )
 
     def __str__(self):
         return self.username
@@ -32,3 +39,7 @@ class CustomUser(AbstractUser):
     class Meta:
         verbose_name = 'User'
         verbose_name_plural = 'Users'
+        indexes = [
+            # Backs the case-insensitive email check at registration (email__iexact)
+            models.Index(Upper('email'), name='accounts_user_email_upper_idx'),
+        ]
@@ -1,17 +1,87 @@
+from collections import Counter
+
 from rest_framework import serializers
 from rest_framework.authtoken.models import Token
 from django.contrib.auth import get_user_model
+from django.db import transaction
 
 User = get_user_model()
 
 
 class UserSerializer(serializers.ModelSerializer):
-    """Serializer for the CustomUser model."""
+    """
+    Serializer for the CustomUser model.
+    
+    Followers and following are linked as paginated sub-resources rather than
+    embedded id lists, so the payload stays small for popular users.
+    Requires the request in the serializer context to build the links.
+    """
+    followers_url = serializers.HyperlinkedIdentityField(view_name='user-followers', lookup_url_kwarg='user_id')
+    following_url = serializers.HyperlinkedIdentityField(view_name='user-following', lookup_url_kwarg='user_id')
+    
+    class Meta:
+        model = User
+        fields = ['id', 'username', 'email', 'bio', 'profile_picture', 'followers_url', 'following_url', 'date_joined']
+        read_only_fields = ['id', 'date_joined']
+
+
+class UserListSerializer(serializers.ModelSerializer):
+    """
+    Lightweight serializer for listing users.
     
+    Exposes follower and following counts instead of id lists; the counts are
+    read from annotations added with annotate_follow_counts().
+    """
+    followers_count = serializers.IntegerField(read_only=True)
+    following_count = serializers.IntegerField(read_only=True)
+
     class Meta:
         model = User
-        fields = ['id', 'username', 'email', 'bio', 'profile_picture', 'followers', 'following', 'date_joined']
-        read_only_fields = ['id', 'date_joined', 'followers', 'following']
+        fields = ['id', 'username', 'email', 'bio', 'profile_picture', 'followers_count', 'following_count', 'date_joined']
+        read_only_fields = fields
+
+
+class UserRegistrationListSerializer(serializers.ListSerializer):
+    """
+    Register many users at once, e.g. from a seed or import script.
+    
+    Used automatically by UserRegistrationSerializer(data=[...], many=True).
+    Users and their tokens are each written with a single bulk INSERT in one
+    transaction instead of two INSERTs per user.
+    """
+
+    def validate(self, attrs):
+        """
+        Reject usernames or emails repeated within the batch.
+        
+        Each child only checks against existing users, so without this a
+        duplicate inside the batch would fail the bulk INSERT with an
+        IntegrityError. Emails are compared ignoring case, as in
+        UserRegistrationSerializer.validate_email().
+        """
+        usernames = Counter(User.normalize_username(item['username']) for item in attrs)
+        duplicates = [name for name, count in usernames.items() if count > 1]
+        if duplicates:
+            raise serializers.ValidationError(
+                f"Duplicate usernames in batch: {', '.join(sorted(duplicates))}."
+            )
+        
+        emails = Counter(item['email'].lower() for item in attrs)
+        duplicates = [email for email, count in emails.items() if count > 1]
+        if duplicates:
+            raise serializers.ValidationError(
+                f"Duplicate emails in batch: {', '.join(sorted(duplicates))}."
+            )
+        return attrs
+
+    def create(self, validated_data):
+        users = [self.child.build_user(attrs) for attrs in validated_data]
+        with transaction.atomic():
+            users = User.objects.bulk_create(users)
+            Token.objects.bulk_create(
+                [Token(user=user, key=Token.generate_key()) for user in users]
+            )
+        return users
 
 
 class UserRegistrationSerializer(serializers.ModelSerializer):
@@ -23,6 +93,7 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ['id', 'username', 'email', 'password', 'password2', 'bio', 'profile_picture', 'token']
+        list_serializer_class = UserRegistrationListSerializer
         extra_kwargs = {
             'email': {'required': True},
             'bio': {'required': False},
@@ -36,30 +107,36 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         return attrs
 
     def validate_email(self, value):
-        """Validate that email is unique."""
-        if User.objects.filter(email=value).exists():
+        """Validate that email is unique, ignoring case."""
+        if User.objects.filter(email__iexact=value).exists():
             raise serializers.ValidationError('A user with this email already exists.')
         return value
 
-    def create(self, validated_data):
-        """Create a new user and generate a token."""
-        validated_data.pop('password2')
-        password = validated_data.pop('password')
-        
-        user = get_user_model().objects.create_user(
-            username=validated_data['username'],
-            email=validated_data.get('email', ''),
-            password=password,
+    def build_user(self, validated_data):
+        """Build an unsaved user from validated data, with its password hashed."""
+        user = User(
+            username=User.normalize_username(validated_data['username']),
+            email=User.objects.normalize_email(validated_data.get('email', '')),
             bio=validated_data.get('bio', ''),
+            profile_picture=validated_data.get('profile_picture'),
         )
+        user.set_password(validated_data['password'])
+        return user
+
+    def create(self, validated_data):
+        """
+        Create a new user and generate a token.
         
-        # Handle profile picture if provided
-        if 'profile_picture' in validated_data:
-            user.profile_picture = validated_data['profile_picture']
-            user.save()
+        The user, including any profile picture, is written with a single
+        INSERT, and the token is created in the same transaction. The token is
+        cached on user.auth_token, so callers can read it without a query.
+        """
+        user = self.build_user(validated_data)
         
-        # Create auth token for the user
-        Token.objects.create(user=user)
+        with transaction.atomic():
+            user.save()
+            # Create auth token for the user
+            Token.objects.create(user=user)
         
         return user
 
@@ -72,19 +149,26 @@ class UserLoginSerializer(serializers.Serializer):
 
 
 class UserProfileSerializer(serializers.ModelSerializer):
-    """Serializer for viewing and updating user profile."""
-    followers_count = serializers.SerializerMethodField()
-    following_count = serializers.SerializerMethodField()
+    """
+    Serializer for viewing and updating user profile.
+    
+    followers_count and following_count are read from annotations of the same
+    name, which the views add with annotate_follow_counts().
+    """
+    followers_count = serializers.IntegerField(read_only=True)
+    following_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = User
         fields = ['id', 'username', 'email', 'bio', 'profile_picture', 'followers_count', 'following_count', 'date_joined']
         read_only_fields = ['id', 'username', 'date_joined']
 
-    def get_followers_count(self, obj):
-        """Get the number of followers."""
-        return obj.followers.count()
-
-    def get_following_count(self, obj):
-        """Get the number of users this user is following."""
-        return obj.following.count()
+    def update(self, instance, validated_data):
+        """
+        Save only the submitted fields, so a profile edit cannot overwrite
+        counters such as unread_notifications with a stale value.
+        """
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save(update_fields=list(validated_data))
+        return instance
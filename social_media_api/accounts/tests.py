@@ -1,3 +1,151 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+from django.db import IntegrityError
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from notifications.models import Notification
+from .models import CustomUser
+from .serializers import UserRegistrationSerializer
+
+
+@override_settings(SECURE_SSL_REDIRECT=False)
+class FollowUserTests(APITestCase):
+    """Tests for following and unfollowing users."""
+
+    def setUp(self):
+        self.user = CustomUser.objects.create_user('follower', password='pw123456')
+        self.target = CustomUser.objects.create_user('target', password='pw123456')
+        self.client.force_authenticate(self.user)
+        self.follow_url = reverse('follow-user', args=[self.target.id])
+        self.unfollow_url = reverse('unfollow-user', args=[self.target.id])
+
+    def test_follow_creates_follow_and_notification(self):
+        response = self.client.post(self.follow_url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(self.target.followers.filter(pk=self.user.pk).exists())
+        self.assertEqual(Notification.objects.filter(recipient=self.target).count(), 1)
+        self.target.refresh_from_db()
+        self.assertEqual(self.target.unread_notifications, 1)
+
+    def test_repeat_follow_returns_400_and_changes_nothing(self):
+        self.client.post(self.follow_url)
+
+        response = self.client.post(self.follow_url)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.target.followers.count(), 1)
+        self.assertEqual(Notification.objects.filter(recipient=self.target).count(), 1)
+        self.target.refresh_from_db()
+        self.assertEqual(self.target.unread_notifications, 1)
+
+    def test_notification_integrity_error_is_not_reported_as_repeat_follow(self):
+        with mock.patch.object(
+            Notification.objects, 'create', side_effect=IntegrityError('notification')
+        ):
+            with self.assertRaisesMessage(IntegrityError, 'notification'), \
+                    self.assertLogs('django.request', 'ERROR'):
+                self.client.post(self.follow_url)
+
+        # The follow row is rolled back with the failed notification
+        self.assertFalse(self.target.followers.exists())
+
+    def test_cannot_follow_yourself(self):
+        response = self.client.post(reverse('follow-user', args=[self.user.id]))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(self.user.followers.exists())
+
+    def test_unfollow_removes_follow(self):
+        self.client.post(self.follow_url)
+
+        response = self.client.post(self.unfollow_url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(self.target.followers.exists())
+
+    def test_unfollow_without_following_returns_400(self):
+        response = self.client.post(self.unfollow_url)
+
+        self.assertEqual(response.status_code, 400)
+
+
+@override_settings(SECURE_SSL_REDIRECT=False)
+class UserListPaginationTests(APITestCase):
+    """Tests for the cursor-paginated user lists."""
+
+    def setUp(self):
+        self.users = [
+            CustomUser.objects.create_user(f'user{i}', password='pw123456')
+            for i in range(15)
+        ]
+        self.client.force_authenticate(self.users[0])
+
+    def test_user_list_pages_through_every_user_in_id_order(self):
+        ids = []
+        url = reverse('user-list')
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            ids.extend(user['id'] for user in response.data['results'])
+            url = response.data['next']
+
+        self.assertEqual(ids, [user.id for user in self.users])
+
+    def test_followers_list_shows_follow_counts(self):
+        self.users[1].followers.add(self.users[0], self.users[2])
+
+        response = self.client.get(reverse('user-followers', args=[self.users[1].id]))
+
+        self.assertEqual(
+            [user['id'] for user in response.data['results']],
+            [self.users[0].id, self.users[2].id],
+        )
+        self.assertEqual(response.data['results'][0]['following_count'], 1)
+
+
+class BulkRegistrationTests(APITestCase):
+    """Tests for registering many users with UserRegistrationListSerializer."""
+
+    def registration(self, username, email):
+        return {
+            'username': username,
+            'email': email,
+            'password': 'pw123456',
+            'password2': 'pw123456',
+        }
+
+    def test_batch_creates_users_and_tokens(self):
+        serializer = UserRegistrationSerializer(data=[
+            self.registration('alice', 'alice@example.com'),
+            self.registration('bob', 'bob@example.com'),
+        ], many=True)
+
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        serializer.save()
+
+        self.assertEqual(
+            sorted(CustomUser.objects.filter(auth_token__isnull=False).values_list('username', flat=True)),
+            ['alice', 'bob'],
+        )
+
+    def test_duplicates_within_batch_are_rejected(self):
+        batches = {
+            'username': [
+                self.registration('alice', 'alice@example.com'),
+                self.registration('alice', 'other@example.com'),
+            ],
+            'email': [
+                self.registration('alice', 'alice@example.com'),
+                self.registration('bob', 'ALICE@example.com'),
+            ],
+        }
+        for field, data in batches.items():
+            with self.subTest(field=field):
+                serializer = UserRegistrationSerializer(data=data, many=True)
+
+                self.assertFalse(serializer.is_valid())
+                self.assertIn(f'Duplicate {field}s in batch', str(serializer.errors))
+                self.assertFalse(CustomUser.objects.exists())
@@ -14,6 +14,10 @@ urlpatterns = [
     # List all users
     path('users/', views.UserListView.as_view(), name='user-list'),
     
+    # A user's followers and the users they follow
+    path('users/<int:user_id>/followers/', views.UserFollowersView.as_view(), name='user-followers'),
+    path('users/<int:user_id>/following/', views.UserFollowingView.as_view(), name='user-following'),
+    
     # Follow/Unfollow users
     path('follow/<int:user_id>/', views.FollowUserView.as_view(), name='follow-user'),
     path('unfollow/<int:user_id>/', views.UnfollowUserView.as_view(), name='unfollow-user'),
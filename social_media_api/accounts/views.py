@@ -3,13 +3,18 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.authtoken.models import Token
 from rest_framework.decorators import api_view, permission_classes
+from rest_framework.pagination import CursorPagination
 from django.contrib.auth import authenticate
 from django.shortcuts import get_object_or_404
 from django.contrib.contenttypes.models import ContentType
+from django.db import IntegrityError, transaction
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 
 from .models import CustomUser
 from .serializers import (
     UserSerializer,
+    UserListSerializer,
     UserRegistrationSerializer,
     UserLoginSerializer,
     UserProfileSerializer,
@@ -17,6 +22,30 @@ from .serializers import (
 from notifications.models import Notification
 
 
+def annotate_follow_counts(queryset):
+    """
+    Annotate users with followers_count and following_count.
+    
+    Each count is a correlated subquery on the followers table rather than a
+    Count() over two joins, so the row count does not multiply as the graph grows.
+    """
+    follows = CustomUser.followers.through.objects
+
+    def count_where(field):
+        counts = (
+            follows.filter(**{field: OuterRef('pk')})
+            .values(field)
+            .annotate(count=Count('*'))
+            .values('count')
+        )
+        return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+    return queryset.annotate(
+        followers_count=count_where('from_customuser'),
+        following_count=count_where('to_customuser'),
+    )
+
+
 class UserRegistrationView(generics.CreateAPIView):
     """
     API view for user registration.
@@ -31,11 +60,11 @@ class UserRegistrationView(generics.CreateAPIView):
         serializer.is_valid(raise_exception=True)
         user = serializer.save()
         
-        # Get the token for the user
-        token = Token.objects.get(user=user)
+        # The serializer caches the new token on the user
+        token = user.auth_token
         
         return Response({
-            'user': UserSerializer(user).data,
+            'user': UserSerializer(user, context=self.get_serializer_context()).data,
             'token': token.key,
             'message': 'User registered successfully.'
         }, status=status.HTTP_201_CREATED)
@@ -62,7 +91,7 @@ class UserLoginView(APIView):
             token, created = Token.objects.get_or_create(user=user)
             
             return Response({
-                'user': UserSerializer(user).data,
+                'user': UserSerializer(user, context={'request': request}).data,
                 'token': token.key,
                 'message': 'Login successful.'
             }, status=status.HTTP_200_OK)
@@ -81,8 +110,8 @@ class UserProfileView(generics.RetrieveUpdateAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_object(self):
-        """Return the current authenticated user."""
-        return self.request.user
+        """Return the current authenticated user, with follower counts annotated."""
+        return annotate_follow_counts(CustomUser.objects.all()).get(pk=self.request.user.pk)
 
     def update(self, request, *args, **kwargs):
         partial = kwargs.pop('partial', False)
@@ -97,14 +126,64 @@ class UserProfileView(generics.RetrieveUpdateAPIView):
         })
 
 
+class UserCursorPagination(CursorPagination):
+    """
+    Cursor pagination over user ids.
+    
+    Each page seeks past the last id seen instead of using OFFSET, so deep
+    pages of a large user table cost the same as the first.
+    """
+    ordering = 'id'
+
+
 class UserListView(generics.ListAPIView):
     """
     API view for listing all users.
     Requires authentication.
+    
+    Results are cursor-paginated and show follower/following counts rather
+    than id lists, so each page is a single query of bounded size.
     """
-    queryset = CustomUser.objects.all()
-    serializer_class = UserSerializer
+    queryset = CustomUser.objects.only(
+        'id', 'username', 'email', 'bio', 'profile_picture', 'date_joined'
+    ).order_by('id')
+    serializer_class = UserListSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    pagination_class = UserCursorPagination
+
+    def get_queryset(self):
+        """Annotate each user with follower and following counts."""
+        return annotate_follow_counts(super().get_queryset())
+
+
+class UserFollowersView(generics.ListAPIView):
+    """
+    API view for listing the followers of a user.
+    Requires authentication.
+    """
+    serializer_class = UserListSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    pagination_class = UserCursorPagination
+
+    def get_queryset(self):
+        """Return the users who follow the user with the given user_id."""
+        user = get_object_or_404(CustomUser.objects.only('id'), id=self.kwargs['user_id'])
+        return annotate_follow_counts(UserListView.queryset.filter(following=user))
+
+
+class UserFollowingView(generics.ListAPIView):
+    """
+    API view for listing the users a user follows.
+    Requires authentication.
+    """
+    serializer_class = UserListSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = UserCursorPagination
+
+    def get_queryset(self):
+        """Return the users followed by the user with the given user_id."""
+        user = get_object_or_404(CustomUser.objects.only('id'), id=self.kwargs['user_id'])
+        return annotate_follow_counts(UserListView.queryset.filter(followers=user))
 
 
 class FollowUserView(generics.GenericAPIView):
@@ -117,7 +196,7 @@ class FollowUserView(generics.GenericAPIView):
 
     def post(self, request, user_id):
         """Follow the user with the given user_id."""
-        user_to_follow = get_object_or_404(CustomUser, id=user_id)
+        user_to_follow = get_object_or_404(CustomUser.objects.only('id', 'username'), id=user_id)
         
         # Cannot follow yourself
         if user_to_follow == request.user:
@@ -125,23 +204,31 @@ class FollowUserView(generics.GenericAPIView):
                 'error': 'You cannot follow yourself.'
             }, status=status.HTTP_400_BAD_REQUEST)
         
-        # Check if already following
-        if request.user.following.filter(id=user_id).exists():
-            return Response({
-                'error': f'You are already following {user_to_follow.username}.'
-            }, status=status.HTTP_400_BAD_REQUEST)
-        
         # Add to following (which adds current user to target's followers)
-        user_to_follow.followers.add(request.user)
-        
-        # Create notification for the followed user
-        Notification.objects.create(
-            recipient=user_to_follow,
-            actor=request.user,
-            verb='started following you',
-            target_content_type=ContentType.objects.get_for_model(request.user),
-            target_object_id=request.user.id
-        )
+        # and notify the followed user in one transaction. The follow row is
+        # inserted directly: followers.add() would SELECT existing rows first.
+        # The unique (from, to) constraint rejects a repeat follow, so no
+        # separate check is needed. Only that insert is caught; any other
+        # integrity error, e.g. from the notification, propagates.
+        with transaction.atomic():
+            try:
+                with transaction.atomic():
+                    CustomUser.followers.through.objects.create(
+                        from_customuser_id=user_to_follow.id,
+                        to_customuser_id=request.user.id,
+                    )
+            except IntegrityError:
+                return Response({
+                    'error': f'You are already following {user_to_follow.username}.'
+                }, status=status.HTTP_400_BAD_REQUEST)
+            
+            Notification.objects.create(
+                recipient=user_to_follow,
+                actor=request.user,
+                verb='started following you',
+                target_content_type=ContentType.objects.get_for_model(request.user),
+                target_object_id=request.user.id
+            )
         
         return Response({
             'message': f'You are now following {user_to_follow.username}.',
@@ -159,7 +246,7 @@ class UnfollowUserView(generics.GenericAPIView):
 
     def post(self, request, user_id):
         """Unfollow the user with the given user_id."""
-        user_to_unfollow = get_object_or_404(CustomUser, id=user_id)
+        user_to_unfollow = get_object_or_404(CustomUser.objects.only('id', 'username'), id=user_id)
         
         # Cannot unfollow yourself
         if user_to_unfollow == request.user:
@@ -167,15 +254,17 @@ class UnfollowUserView(generics.GenericAPIView):
                 'error': 'You cannot unfollow yourself.'
             }, status=status.HTTP_400_BAD_REQUEST)
         
-        # Check if not following
-        if not request.user.following.filter(id=user_id).exists():
+        # Remove from following with a single DELETE; nothing deleted means
+        # the user was not following
+        deleted, _ = CustomUser.followers.through.objects.filter(
+            from_customuser_id=user_to_unfollow.id,
+            to_customuser_id=request.user.id,
+        ).delete()
+        if not deleted:
             return Response({
                 'error': f'You are not following {user_to_unfollow.username}.'
             }, status=status.HTTP_400_BAD_REQUEST)
         
-        # Remove from following
-        user_to_unfollow.followers.remove(request.user)
-        
         return Response({
             'message': f'You have unfollowed {user_to_unfollow.username}.',
             'unfollowed': user_to_unfollow.username
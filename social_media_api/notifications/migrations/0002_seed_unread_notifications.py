@@ -0,0 +1,31 @@
+from django.db import migrations
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def seed_unread_notifications(apps, schema_editor):
+    """Fill each user's unread_notifications from the existing notifications."""
+    User = apps.get_model('accounts', 'CustomUser')
+    Notification = apps.get_model('notifications', 'Notification')
+    counts = (
+        Notification.objects.filter(recipient=OuterRef('pk'), read=False)
+        .order_by()
+        .values('recipient')
+        .annotate(count=Count('*'))
+        .values('count')
+    )
+    User.objects.update(
+        unread_notifications=Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_customuser_unread_notifications'),
+        ('notifications', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_unread_notifications, migrations.RunPython.noop),
+    ]
@@ -1,7 +1,11 @@
 from django.db import models
 from django.conf import settings
+from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 
 class Notification(models.Model):
@@ -43,6 +47,49 @@ class Notification(models.Model):
         ordering = ['-timestamp']
         verbose_name = 'Notification'
         verbose_name_plural = 'Notifications'
+        indexes = [
+            # Serves the recipient + read=False lookups in order of
+            # timestamp; recipient alone still uses the leading column
+            models.Index(fields=['recipient', 'read', '-timestamp'], name='notif_recipient_read_ts'),
+        ]
 
     def __str__(self):
         return f"{self.actor.username} {self.verb}"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored read flag so saving can tell whether it changed;
+        # None when the field was deferred
+        instance._loaded_read = instance.__dict__.get('read')
+        return instance
+
+
+def adjust_unread_count(user_id, delta):
+    """Add delta to the user's denormalized unread notification counter."""
+    if delta:
+        get_user_model().objects.filter(pk=user_id).update(
+            unread_notifications=F('unread_notifications') + delta
+        )
+
+
+# Count unread notifications as they are created, saved with a changed read
+# flag, or deleted. Marking notifications read is a QuerySet.update() in the
+# views, which send no signals and adjust the counter themselves.
+@receiver(post_save, sender=Notification)
+def count_saved_notification(sender, instance, created, update_fields, **kwargs):
+    if created:
+        if not instance.read:
+            adjust_unread_count(instance.recipient_id, 1)
+    elif update_fields is None or 'read' in update_fields:
+        loaded = getattr(instance, '_loaded_read', None)
+        if loaded is not None and loaded != instance.read:
+            adjust_unread_count(instance.recipient_id, -1 if instance.read else 1)
+    instance._loaded_read = instance.__dict__.get('read')
+
+
+@receiver(post_delete, sender=Notification)
+def uncount_deleted_notification(sender, instance, **kwargs):
+    # Only unread notifications are in the counter
+    if not instance.read:
+        adjust_unread_count(instance.recipient_id, -1)
@@ -1,3 +1,148 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.db import DatabaseError
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from .models import Notification
+
+User = get_user_model()
+
+
+class UnreadCounterTests(TestCase):
+    """Tests for the unread_notifications counter kept on the recipient."""
+
+    def setUp(self):
+        self.recipient = User.objects.create_user('recipient', password='pw123456')
+        self.actor = User.objects.create_user('actor', password='pw123456')
+
+    def notify(self, **kwargs):
+        return Notification.objects.create(
+            recipient=self.recipient, actor=self.actor, verb='did something', **kwargs
+        )
+
+    def assertUnread(self, expected):
+        self.recipient.refresh_from_db()
+        self.assertEqual(self.recipient.unread_notifications, expected)
+        self.assertEqual(
+            Notification.objects.filter(recipient=self.recipient, read=False).count(),
+            expected,
+        )
+
+    def test_creating_counts_only_unread_notifications(self):
+        self.notify()
+        self.notify(read=True)
+
+        self.assertUnread(1)
+
+    def test_saving_a_loaded_notification_as_read_and_unread(self):
+        self.notify()
+        notification = Notification.objects.get()
+
+        notification.read = True
+        notification.save()
+        self.assertUnread(0)
+
+        # Saving again without a change leaves the counter alone
+        notification.save()
+        self.assertUnread(0)
+
+        notification.read = False
+        notification.save(update_fields=['read'])
+        self.assertUnread(1)
+
+    def test_saving_other_fields_keeps_the_counter(self):
+        self.notify()
+        notification = Notification.objects.get()
+
+        notification.verb = 'did something else'
+        notification.save(update_fields=['verb'])
+
+        self.assertUnread(1)
+
+    def test_deleting_unread_and_read_notifications(self):
+        unread = self.notify()
+        read = self.notify(read=True)
+
+        read.delete()
+        self.assertUnread(1)
+
+        unread.delete()
+        self.assertUnread(0)
+
+    def test_deleting_the_actor_uncounts_their_notifications(self):
+        self.notify()
+        self.notify(read=True)
+
+        self.actor.delete()
+
+        self.assertUnread(0)
+
+
+@override_settings(SECURE_SSL_REDIRECT=False)
+class MarkReadViewTests(APITestCase):
+    """Tests for the mark-read endpoints and the unread count they maintain."""
+
+    def setUp(self):
+        self.recipient = User.objects.create_user('recipient', password='pw123456')
+        actor = User.objects.create_user('actor', password='pw123456')
+        self.notifications = [
+            Notification.objects.create(recipient=self.recipient, actor=actor, verb='did something')
+            for _ in range(3)
+        ]
+        self.client.force_authenticate(self.recipient)
+
+    def unread_count(self):
+        self.recipient.refresh_from_db()
+        return self.recipient.unread_notifications
+
+    def test_mark_read_decrements_once(self):
+        url = reverse('notification-read', args=[self.notifications[0].id])
+
+        self.assertEqual(self.client.post(url).status_code, 200)
+        self.assertEqual(self.client.post(url).status_code, 200)
+
+        self.assertEqual(self.unread_count(), 2)
+
+    def test_mark_read_of_another_users_notification_is_404(self):
+        other = User.objects.create_user('other', password='pw123456')
+        self.client.force_authenticate(other)
+
+        response = self.client.post(reverse('notification-read', args=[self.notifications[0].id]))
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(self.unread_count(), 3)
+
+    def test_mark_all_read_clears_the_counter(self):
+        self.client.post(reverse('notification-read', args=[self.notifications[0].id]))
+
+        response = self.client.post(reverse('notifications-mark-all-read'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.unread_count(), 0)
+
+    def test_unread_count_endpoint_reads_the_counter(self):
+        # Authenticate with the stored row, as token authentication would
+        self.client.force_authenticate(User.objects.get(pk=self.recipient.pk))
+
+        response = self.client.get(reverse('notifications-unread-count'))
+
+        self.assertEqual(response.data, {'unread_count': 3})
+
+    def test_failed_counter_update_rolls_back_the_read_flags(self):
+        urls = [
+            reverse('notification-read', args=[self.notifications[0].id]),
+            reverse('notifications-mark-all-read'),
+        ]
+        for url in urls:
+            with self.subTest(url=url), mock.patch(
+                'notifications.views.adjust_unread_count', side_effect=DatabaseError('counter')
+            ):
+                with self.assertRaisesMessage(DatabaseError, 'counter'), \
+                        self.assertLogs('django.request', 'ERROR'):
+                    self.client.post(url)
+
+                self.assertFalse(Notification.objects.filter(read=True).exists())
+                self.assertEqual(self.unread_count(), 3)
@@ -1,10 +1,25 @@
+from django.db import transaction
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from .models import Notification
+from .models import Notification, adjust_unread_count
 from .serializers import NotificationSerializer
 
 
+def notifications_for(user):
+    """
+    Return the user's notifications with the actor, recipient and target
+    content type joined, since the serializer reads from all three. Only the
+    id and username of the actor and recipient are loaded.
+    """
+    return Notification.objects.select_related(
+        'actor', 'recipient', 'target_content_type'
+    ).only(
+        'id', 'verb', 'target_content_type', 'target_object_id', 'timestamp', 'read',
+        'actor__id', 'actor__username', 'recipient__id', 'recipient__username',
+    ).filter(recipient=user)
+
+
 class NotificationListView(generics.ListAPIView):
     """
     API view for listing all notifications for the current user.
@@ -16,7 +31,7 @@ class NotificationListView(generics.ListAPIView):
 
     def get_queryset(self):
         """Return notifications for the current user."""
-        return Notification.objects.filter(recipient=self.request.user)
+        return notifications_for(self.request.user)
 
 
 class NotificationDetailView(generics.RetrieveAPIView):
@@ -28,7 +43,7 @@ class NotificationDetailView(generics.RetrieveAPIView):
 
     def get_queryset(self):
         """Return only notifications belonging to the current user."""
-        return Notification.objects.filter(recipient=self.request.user)
+        return notifications_for(self.request.user)
 
 
 class MarkNotificationReadView(APIView):
@@ -39,18 +54,25 @@ class MarkNotificationReadView(APIView):
 
     def post(self, request, pk):
         """Mark the notification as read."""
-        try:
-            notification = Notification.objects.get(pk=pk, recipient=request.user)
-            notification.read = True
-            notification.save()
-            return Response({
-                'message': 'Notification marked as read.',
-                'notification_id': pk
-            }, status=status.HTTP_200_OK)
-        except Notification.DoesNotExist:
-            return Response({
-                'error': 'Notification not found.'
-            }, status=status.HTTP_404_NOT_FOUND)
+        # A single-column UPDATE with no SELECT first. Only an unread row is
+        # updated, so a repeated request cannot decrement the counter twice.
+        # The flag and the counter change in one transaction so they never
+        # drift apart.
+        notifications = Notification.objects.filter(pk=pk, recipient=request.user)
+        with transaction.atomic():
+            marked = notifications.filter(read=False).update(read=True)
+            
+            # Nothing updated: either already read or not this user's notification
+            if not marked and not notifications.exists():
+                return Response({
+                    'error': 'Notification not found.'
+                }, status=status.HTTP_404_NOT_FOUND)
+            
+            adjust_unread_count(request.user.id, -marked)
+        return Response({
+            'message': 'Notification marked as read.',
+            'notification_id': pk
+        }, status=status.HTTP_200_OK)
 
 
 class MarkAllNotificationsReadView(APIView):
@@ -61,10 +83,13 @@ class MarkAllNotificationsReadView(APIView):
 
     def post(self, request):
         """Mark all notifications for the current user as read."""
-        updated_count = Notification.objects.filter(
-            recipient=request.user,
-            read=False
-        ).update(read=True)
+        # Update the flags and the counter together, as in MarkNotificationReadView
+        with transaction.atomic():
+            updated_count = Notification.objects.filter(
+                recipient=request.user,
+                read=False
+            ).update(read=True)
+            adjust_unread_count(request.user.id, -updated_count)
         
         return Response({
             'message': f'{updated_count} notifications marked as read.'
@@ -79,11 +104,7 @@ class UnreadNotificationCountView(APIView):
 
     def get(self, request):
         """Return the count of unread notifications."""
-        count = Notification.objects.filter(
-            recipient=request.user,
-            read=False
-        ).count()
-        
+        # Read the counter kept on the user row instead of counting rows
         return Response({
-            'unread_count': count
+            'unread_count': request.user.unread_notifications
         }, status=status.HTTP_200_OK)
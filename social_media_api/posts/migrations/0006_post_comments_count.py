@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-15 05:19
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def seed_post_counters(apps, schema_editor):
+    """
+    Fill comments_count from existing comments, and recount likes_count so
+    both counters start from the rows actually stored.
+    """
+    Post = apps.get_model('posts', 'Post')
+    Comment = apps.get_model('posts', 'Comment')
+    Like = apps.get_model('posts', 'Like')
+
+    def count_of(model):
+        counts = (
+            model.objects.filter(post=OuterRef('pk'))
+            .order_by()
+            .values('post')
+            .annotate(count=Count('*'))
+            .values('count')
+        )
+        return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+    Post.objects.update(comments_count=count_of(Comment), likes_count=count_of(Like))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0005_post_post_created_id_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='comments_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(seed_post_counters, migrations.RunPython.noop),
+    ]
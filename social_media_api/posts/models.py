@@ -1,5 +1,8 @@
 from django.db import models
 from django.conf import settings
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 
 class Post(models.Model):
@@ -11,6 +14,10 @@ class Post(models.Model):
     )
     title = models.CharField(max_length=255)
     content = models.TextField()
+    # Kept in step by the Comment and Like signal receivers below, so
+    # listing posts never counts comments or likes
+    comments_count = models.PositiveIntegerField(default=0, editable=False)
+    likes_count = models.PositiveIntegerField(default=0, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -18,6 +25,10 @@ class Post(models.Model):
         ordering = ['-created_at']
         verbose_name = 'Post'
         verbose_name_plural = 'Posts'
+        indexes = [
+            # Newest-first listing and the feed's cursor seeks
+            models.Index(fields=['-created_at', '-id'], name='post_created_id_idx'),
+        ]
 
     def __str__(self):
         return f"{self.title} by {self.author.username}"
@@ -65,8 +76,43 @@ class Like(models.Model):
     class Meta:
         unique_together = ('post', 'user')
         ordering = ['-created_at']
+        indexes = [
+            # A user's likes, newest first; (post, user) is already covered
+            # by the unique constraint
+            models.Index(fields=['user', '-created_at'], name='like_user_created_idx'),
+        ]
         verbose_name = 'Like'
         verbose_name_plural = 'Likes'
 
     def __str__(self):
         return f"{self.user.username} likes {self.post.title}"
+
+
+def adjust_post_counter(post_id, field, delta):
+    """Add delta to one of a post's denormalized counters."""
+    Post.objects.filter(pk=post_id).update(**{field: F(field) + delta})
+
+
+# Count comments and likes as they are created and deleted. Deleting a post
+# cascades to its comments and likes, whose receivers then update a row that
+# is about to go; the updates are harmless.
+@receiver(post_save, sender=Comment)
+def count_new_comment(sender, instance, created, **kwargs):
+    if created:
+        adjust_post_counter(instance.post_id, 'comments_count', 1)
+
+
+@receiver(post_delete, sender=Comment)
+def uncount_deleted_comment(sender, instance, **kwargs):
+    adjust_post_counter(instance.post_id, 'comments_count', -1)
+
+
+@receiver(post_save, sender=Like)
+def count_new_like(sender, instance, created, **kwargs):
+    if created:
+        adjust_post_counter(instance.post_id, 'likes_count', 1)
+
+
+@receiver(post_delete, sender=Like)
+def uncount_deleted_like(sender, instance, **kwargs):
+    adjust_post_counter(instance.post_id, 'likes_count', -1)
@@ -1,8 +1,9 @@
 from rest_framework import serializers
+from social_media_api.serializers import CachedFieldsModelSerializer
 from .models import Post, Comment, Like
 
 
-class CommentSerializer(serializers.ModelSerializer):
+class CommentSerializer(CachedFieldsModelSerializer):
     """Serializer for the Comment model."""
     author = serializers.ReadOnlyField(source='author.username')
     author_id = serializers.ReadOnlyField(source='author.id')
@@ -12,8 +13,17 @@ class CommentSerializer(serializers.ModelSerializer):
         fields = ['id', 'post', 'author', 'author_id', 'content', 'created_at', 'updated_at']
         read_only_fields = ['id', 'author', 'author_id', 'created_at', 'updated_at']
 
+    def update(self, instance, validated_data):
+        """
+        Keep a comment on the post it was created on. The post's
+        comments_count is only adjusted when comments are created or deleted,
+        so moving a comment would leave both posts miscounted.
+        """
+        validated_data.pop('post', None)
+        return super().update(instance, validated_data)
 
-class LikeSerializer(serializers.ModelSerializer):
+
+class LikeSerializer(CachedFieldsModelSerializer):
     """Serializer for the Like model."""
     user = serializers.ReadOnlyField(source='user.username')
     user_id = serializers.ReadOnlyField(source='user.id')
@@ -24,44 +34,34 @@ class LikeSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'user', 'user_id', 'created_at']
 
 
-class PostSerializer(serializers.ModelSerializer):
+class PostSerializer(CachedFieldsModelSerializer):
     """Serializer for the Post model."""
     author = serializers.ReadOnlyField(source='author.username')
     author_id = serializers.ReadOnlyField(source='author.id')
     comments = CommentSerializer(many=True, read_only=True)
-    comments_count = serializers.SerializerMethodField()
-    likes_count = serializers.SerializerMethodField()
 
     class Meta:
         model = Post
         fields = ['id', 'author', 'author_id', 'title', 'content', 'created_at', 'updated_at', 'comments', 'comments_count', 'likes_count']
         read_only_fields = ['id', 'author', 'author_id', 'created_at', 'updated_at', 'comments', 'comments_count', 'likes_count']
 
-    def get_comments_count(self, obj):
-        """Get the number of comments on this post."""
-        return obj.comments.count()
-
-    def get_likes_count(self, obj):
-        """Get the number of likes on this post."""
-        return obj.likes.count()
+    def update(self, instance, validated_data):
+        """
+        Save only the submitted fields (and updated_at), so an edit cannot
+        overwrite comments_count or likes_count with a stale value.
+        """
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save(update_fields=[*validated_data, 'updated_at'])
+        return instance
 
 
-class PostListSerializer(serializers.ModelSerializer):
+class PostListSerializer(CachedFieldsModelSerializer):
     """Simplified serializer for listing posts (without nested comments)."""
     author = serializers.ReadOnlyField(source='author.username')
     author_id = serializers.ReadOnlyField(source='author.id')
-    comments_count = serializers.SerializerMethodField()
-    likes_count = serializers.SerializerMethodField()
 
     class Meta:
         model = Post
         fields = ['id', 'author', 'author_id', 'title', 'content', 'created_at', 'updated_at', 'comments_count', 'likes_count']
         read_only_fields = ['id', 'author', 'author_id', 'created_at', 'updated_at', 'comments_count', 'likes_count']
-
-    def get_comments_count(self, obj):
-        """Get the number of comments on this post."""
-        return obj.comments.count()
-
-    def get_likes_count(self, obj):
-        """Get the number of likes on this post."""
-        return obj.likes.count()
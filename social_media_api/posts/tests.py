@@ -1,3 +1,213 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from notifications.models import Notification
+from .models import Comment, Like, Post
+
+User = get_user_model()
+
+
+@override_settings(SECURE_SSL_REDIRECT=False)
+class FeedPaginationTests(APITestCase):
+    """Tests for the cursor-paginated feed."""
+
+    def setUp(self):
+        self.reader = User.objects.create_user('reader', password='pw123456')
+        self.author = User.objects.create_user('author', password='pw123456')
+        self.author.followers.add(self.reader)
+        self.client.force_authenticate(self.reader)
+
+    def test_posts_with_equal_timestamps_page_in_id_order(self):
+        for i in range(15):
+            Post.objects.create(author=self.author, title=f'Post {i}', content='Body')
+        Post.objects.update(created_at=timezone.now())
+
+        ids = []
+        url = reverse('feed')
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            ids.extend(post['id'] for post in response.data['results'])
+            url = response.data['next']
+
+        expected = list(Post.objects.order_by('-id').values_list('id', flat=True))
+        self.assertEqual(ids, expected)
+
+    def test_feed_only_includes_followed_authors(self):
+        stranger = User.objects.create_user('stranger', password='pw123456')
+        followed = Post.objects.create(author=self.author, title='Followed', content='Body')
+        Post.objects.create(author=stranger, title='Stranger', content='Body')
+
+        response = self.client.get(reverse('feed'))
+
+        self.assertEqual([post['id'] for post in response.data['results']], [followed.id])
+
+
+@override_settings(SECURE_SSL_REDIRECT=False)
+class LikePostTests(APITestCase):
+    """Tests for liking and unliking posts and the likes_count counter."""
+
+    def setUp(self):
+        self.user = User.objects.create_user('liker', password='pw123456')
+        self.author = User.objects.create_user('author', password='pw123456')
+        self.post = Post.objects.create(author=self.author, title='Post', content='Body')
+        self.client.force_authenticate(self.user)
+        self.like_url = reverse('like-post', args=[self.post.id])
+        self.unlike_url = reverse('unlike-post', args=[self.post.id])
+
+    def assertLikesCount(self, expected):
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.likes_count, expected)
+        self.assertEqual(self.post.likes.count(), expected)
+
+    def test_like_increments_count_by_one(self):
+        response = self.client.post(self.like_url)
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['likes_count'], 1)
+        self.assertLikesCount(1)
+
+    def test_like_response_reports_the_stored_count(self):
+        other = User.objects.create_user('other', password='pw123456')
+        Like.objects.create(post=self.post, user=other)
+
+        response = self.client.post(self.like_url)
+
+        self.assertEqual(response.data['likes_count'], 2)
+        self.assertLikesCount(2)
+
+    def test_repeat_like_returns_400_and_keeps_count(self):
+        self.client.post(self.like_url)
+
+        response = self.client.post(self.like_url)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertLikesCount(1)
+
+    def test_like_notifies_the_author(self):
+        self.client.post(self.like_url)
+
+        self.assertEqual(Notification.objects.filter(recipient=self.author).count(), 1)
+
+    def test_notification_integrity_error_is_not_reported_as_repeat_like(self):
+        with mock.patch.object(
+            Notification.objects, 'create', side_effect=IntegrityError('notification')
+        ):
+            with self.assertRaisesMessage(IntegrityError, 'notification'), \
+                    self.assertLogs('django.request', 'ERROR'):
+                self.client.post(self.like_url)
+
+        # The like and its counter bump are rolled back with the notification
+        self.assertLikesCount(0)
+
+    def test_unlike_decrements_count_by_one(self):
+        self.client.post(self.like_url)
+
+        response = self.client.post(self.unlike_url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['likes_count'], 0)
+        self.assertLikesCount(0)
+
+    def test_unlike_without_like_returns_400_and_keeps_count(self):
+        response = self.client.post(self.unlike_url)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertLikesCount(0)
+
+
+@override_settings(SECURE_SSL_REDIRECT=False)
+class PostCounterTests(APITestCase):
+    """Tests for the comments_count and likes_count columns on Post."""
+
+    def setUp(self):
+        self.author = User.objects.create_user('author', password='pw123456')
+        self.commenter = User.objects.create_user('commenter', password='pw123456')
+        self.post = Post.objects.create(author=self.author, title='Post', content='Body')
+        self.client.force_authenticate(self.commenter)
+
+    def assertCounts(self, comments, likes):
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.comments_count, comments)
+        self.assertEqual(self.post.comments.count(), comments)
+        self.assertEqual(self.post.likes_count, likes)
+        self.assertEqual(self.post.likes.count(), likes)
+
+    def test_comment_create_and_delete_move_count_by_one(self):
+        response = self.client.post(
+            reverse('comment-list'), {'post': self.post.id, 'content': 'Nice'}
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertCounts(comments=1, likes=0)
+
+        response = self.client.delete(reverse('comment-detail', args=[response.data['id']]))
+        self.assertEqual(response.status_code, 204)
+        self.assertCounts(comments=0, likes=0)
+
+    def test_updating_a_comment_cannot_move_it_to_another_post(self):
+        other = Post.objects.create(author=self.author, title='Other', content='Body')
+        comment = Comment.objects.create(post=self.post, author=self.commenter, content='Nice')
+
+        response = self.client.patch(
+            reverse('comment-detail', args=[comment.id]), {'post': other.id, 'content': 'Edited'}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['post'], self.post.id)
+        self.assertEqual(response.data['content'], 'Edited')
+        self.assertCounts(comments=1, likes=0)
+        other.refresh_from_db()
+        self.assertEqual(other.comments_count, 0)
+
+        # The comment still deletes cleanly from its original post
+        response = self.client.delete(reverse('comment-detail', args=[comment.id]))
+        self.assertEqual(response.status_code, 204)
+        self.assertCounts(comments=0, likes=0)
+
+    def test_post_responses_show_stored_counts(self):
+        Comment.objects.create(post=self.post, author=self.commenter, content='Nice')
+        Like.objects.create(post=self.post, user=self.commenter)
+
+        listed = self.client.get(reverse('post-list')).data['results'][0]
+        detail = self.client.get(reverse('post-detail', args=[self.post.id])).data
+
+        for data in (listed, detail):
+            self.assertEqual(data['comments_count'], 1)
+            self.assertEqual(data['likes_count'], 1)
+
+    def test_editing_a_post_keeps_counts(self):
+        Comment.objects.create(post=self.post, author=self.commenter, content='Nice')
+        Like.objects.create(post=self.post, user=self.commenter)
+        self.client.force_authenticate(self.author)
+
+        response = self.client.patch(
+            reverse('post-detail', args=[self.post.id]), {'title': 'Edited'}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertCounts(comments=1, likes=1)
+
+    def test_deleting_a_user_uncounts_their_comments_and_likes(self):
+        Comment.objects.create(post=self.post, author=self.commenter, content='Nice')
+        Like.objects.create(post=self.post, user=self.commenter)
+
+        self.commenter.delete()
+
+        self.assertCounts(comments=0, likes=0)
+
+    def test_deleting_a_post_removes_its_comments_and_likes(self):
+        Comment.objects.create(post=self.post, author=self.commenter, content='Nice')
+        Like.objects.create(post=self.post, user=self.commenter)
+        self.client.force_authenticate(self.author)
+
+        response = self.client.delete(reverse('post-detail', args=[self.post.id]))
+
+        self.assertEqual(response.status_code, 204)
+        self.assertFalse(Comment.objects.exists())
+        self.assertFalse(Like.objects.exists())
@@ -1,13 +1,32 @@
 from rest_framework import viewsets, permissions, filters, generics, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from rest_framework.pagination import CursorPagination
 from django_filters.rest_framework import DjangoFilterBackend
 from django.contrib.contenttypes.models import ContentType
+from django.db import IntegrityError, transaction
+from django.db.models import Prefetch
 from .models import Post, Comment, Like
 from .serializers import PostSerializer, PostListSerializer, CommentSerializer
 from notifications.models import Notification
 
 
+# Columns the post and comment serializers read
+POST_FIELDS = ('id', 'title', 'content', 'comments_count', 'likes_count', 'created_at', 'updated_at')
+COMMENT_FIELDS = ('id', 'post', 'content', 'created_at', 'updated_at')
+
+# Columns the like and unlike views need from the liked post
+LIKE_TARGET_QUERYSET = Post.objects.only('id', 'author', 'title')
+
+
+def with_author(queryset, *fields):
+    """
+    Join each row's author, loading only the given columns of the row and
+    the author's id and username rather than the whole user row.
+    """
+    return queryset.select_related('author').only(*fields, 'author__id', 'author__username')
+
+
 class IsOwnerOrReadOnly(permissions.BasePermission):
     """
     Custom permission to only allow owners of an object to edit or delete it.
@@ -45,6 +64,20 @@ class PostViewSet(viewsets.ModelViewSet):
             return PostListSerializer
         return PostSerializer
 
+    def get_queryset(self):
+        """
+        Return posts with their author joined.
+        
+        A single post is served with its comments, so retrieve also
+        prefetches them along with each comment's author.
+        """
+        queryset = with_author(Post.objects.all(), *POST_FIELDS)
+        if self.action == 'retrieve':
+            queryset = queryset.prefetch_related(
+                Prefetch('comments', queryset=with_author(Comment.objects.all(), *COMMENT_FIELDS))
+            )
+        return queryset
+
     def perform_create(self, serializer):
         """Set the author to the current user when creating a post."""
         serializer.save(author=self.request.user)
@@ -61,7 +94,7 @@ class CommentViewSet(viewsets.ModelViewSet):
     partial_update: Partial update a comment (owner only)
     destroy: Delete a comment (owner only)
     """
-    queryset = Comment.objects.all()
+    queryset = with_author(Comment.objects.all(), *COMMENT_FIELDS)
     serializer_class = CommentSerializer
     permission_classes = [permissions.IsAuthenticated, IsOwnerOrReadOnly]
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
@@ -74,6 +107,17 @@ class CommentViewSet(viewsets.ModelViewSet):
         serializer.save(author=self.request.user)
 
 
+class FeedCursorPagination(CursorPagination):
+    """
+    Cursor pagination for the feed, newest first.
+    
+    Each page seeks past the last post seen instead of using OFFSET, so deep
+    pages of a long timeline cost the same as the first. id breaks ties
+    between posts created at the same moment.
+    """
+    ordering = ('-created_at', '-id')
+
+
 class FeedView(generics.ListAPIView):
     """
     API view for retrieving the user's feed.
@@ -82,19 +126,21 @@ class FeedView(generics.ListAPIView):
     """
     serializer_class = PostListSerializer
     permission_classes = [permissions.IsAuthenticated]
-    filter_backends = [filters.OrderingFilter]
-    ordering_fields = ['created_at', 'updated_at']
-    ordering = ['-created_at']
+    pagination_class = FeedCursorPagination
+    # No OrderingFilter: the cursor must stay keyed on (-created_at, -id),
+    # which FeedCursorPagination applies itself
+    filter_backends = []
 
     def get_queryset(self):
         """
         Return posts from users that the current user follows.
         """
-        # Get the users that the current user is following
-        following_users = self.request.user.following.all()
-        
-        # Return posts from those users, ordered by most recent
-        return Post.objects.filter(author__in=following_users).order_by('-created_at')
+        # Join through the followers table: posts whose author is followed by
+        # the current user. Each (author, follower) pair is unique, so the
+        # join cannot repeat a post.
+        return with_author(
+            Post.objects.filter(author__followers=self.request.user), *POST_FIELDS
+        )
 
 
 class LikePostView(APIView):
@@ -106,30 +152,41 @@ class LikePostView(APIView):
 
     def post(self, request, pk):
         """Like the post with the given pk."""
-        post = generics.get_object_or_404(Post, pk=pk)
+        post = generics.get_object_or_404(LIKE_TARGET_QUERYSET, pk=pk)
         
-        # Check if already liked
-        like, created = Like.objects.get_or_create(user=request.user, post=post)
-        
-        if not created:
-            return Response({
-                'error': 'You have already liked this post.'
-            }, status=status.HTTP_400_BAD_REQUEST)
+        # Insert the like (whose post_save bumps the post's counter) and
+        # notify the author (unless liking their own post) in one
+        # transaction. The unique (post, user) pair rejects a repeat like, so
+        # no SELECT is needed first. Only that insert is caught; any other
+        # integrity error, e.g. from the notification, propagates. The
+        # author is referenced by id so its row is never loaded;
+        # get_for_model() is served from ContentType's in-process cache.
+        with transaction.atomic():
+            try:
+                with transaction.atomic():
+                    Like.objects.create(user=request.user, post=post)
+            except IntegrityError:
+                return Response({
+                    'error': 'You have already liked this post.'
+                }, status=status.HTTP_400_BAD_REQUEST)
+            
+            if post.author_id != request.user.id:
+                Notification.objects.create(
+                    recipient_id=post.author_id,
+                    actor=request.user,
+                    verb='liked your post',
+                    target_content_type=ContentType.objects.get_for_model(Post),
+                    target_object_id=post.id
+                )
         
-        # Create notification for the post author (if not liking own post)
-        if post.author != request.user:
-            Notification.objects.create(
-                recipient=post.author,
-                actor=request.user,
-                verb='liked your post',
-                target_content_type=ContentType.objects.get_for_model(post),
-                target_object_id=post.id
-            )
+        # Read the counter back rather than adding to the value loaded above,
+        # which concurrent likes may already have changed
+        post.refresh_from_db(fields=['likes_count'])
         
         return Response({
             'message': f'You have liked the post "{post.title}".',
             'post_id': post.id,
-            'likes_count': post.likes.count()
+            'likes_count': post.likes_count
         }, status=status.HTTP_201_CREATED)
 
 
@@ -142,19 +199,21 @@ class UnlikePostView(APIView):
 
     def post(self, request, pk):
         """Unlike the post with the given pk."""
-        post = generics.get_object_or_404(Post, pk=pk)
+        post = generics.get_object_or_404(LIKE_TARGET_QUERYSET, pk=pk)
         
-        # Try to get the like
-        try:
-            like = Like.objects.get(post=post, user=request.user)
-            like.delete()
-            
-            return Response({
-                'message': f'You have unliked the post "{post.title}".',
-                'post_id': post.id,
-                'likes_count': post.likes.count()
-            }, status=status.HTTP_200_OK)
-        except Like.DoesNotExist:
+        # Delete the like, whose post_delete drops the post's counter in the
+        # same transaction; nothing deleted means the user had not liked the post
+        deleted, _ = Like.objects.filter(post=post, user=request.user).delete()
+        
+        if not deleted:
             return Response({
                 'error': 'You have not liked this post.'
             }, status=status.HTTP_400_BAD_REQUEST)
+        
+        post.refresh_from_db(fields=['likes_count'])
+        
+        return Response({
+            'message': f'You have unliked the post "{post.title}".',
+            'post_id': post.id,
+            'likes_count': post.likes_count
+        }, status=status.HTTP_200_OK)
@@ -0,0 +1,25 @@
+"""Serializer base classes shared by the project's apps."""
+import copy
+
+from rest_framework import serializers
+
+
+class CachedFieldsModelSerializer(serializers.ModelSerializer):
+    """
+    ModelSerializer that builds its fields once per class.
+    
+    ModelSerializer.get_fields() introspects the model on every instantiation.
+    The first result is kept on the class and later instances get a deep copy,
+    which re-creates each field from its constructor arguments the same way DRF
+    copies declared fields. Only use this where the fields do not depend on
+    the instance or context.
+    """
+
+    def get_fields(self):
+        cls = type(self)
+        # Look in the class's own __dict__ so subclasses never share a cache
+        fields = cls.__dict__.get('_cached_fields')
+        if fields is None:
+            fields = super().get_fields()
+            cls._cached_fields = fields
+        return copy.deepcopy(fields)
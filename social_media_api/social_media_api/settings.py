@@ -82,6 +82,11 @@ WSGI_APPLICATION = 'social_media_api.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 # Database configuration with explicit credentials
+# Keep connections open between requests instead of reconnecting every time;
+# health checks replace a connection the server has closed before reuse.
+# Set DB_CONN_MAX_AGE=0 when a pooler such as pgbouncer sits in front.
+DB_CONN_MAX_AGE = config('DB_CONN_MAX_AGE', default=60, cast=int)
+
 DATABASES = {
     'default': {
         'ENGINE': config('DB_ENGINE', default='django.db.backends.sqlite3'),
@@ -90,13 +95,25 @@ DATABASES = {
         'PASSWORD': config('DB_PASSWORD', default=''),
         'HOST': config('DB_HOST', default=''),
         'PORT': config('DB_PORT', default=''),
+        'CONN_MAX_AGE': DB_CONN_MAX_AGE,
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
 # Use DATABASE_URL if provided (for Heroku/production)
 DATABASE_URL = config('DATABASE_URL', default=None)
 if DATABASE_URL:
-    DATABASES['default'] = dj_database_url.config(default=DATABASE_URL)
+    DATABASES['default'] = dj_database_url.config(
+        default=DATABASE_URL,
+        conn_max_age=DB_CONN_MAX_AGE,
+        conn_health_checks=True,
+    )
+
+# pgbouncer in transaction pooling mode cannot keep server-side cursors
+# open across transactions
+DATABASES['default']['DISABLE_SERVER_SIDE_CURSORS'] = config(
+    'DB_DISABLE_SERVER_SIDE_CURSORS', default=False, cast=bool
+)
 
 
 # Password validation